@@ -0,0 +1,53 @@
+# Headless core of the Quantum Maze Solver.
+#
+# Importing the package only loads the maze grid, the generators and the
+# mesa-free engines. The solver add-ons (dead-end filling, junction graphs,
+# distance fields, incremental solving) and the mesa agents (and, through
+# quantum_maze.render, pygame) are imported the first time one of their names
+# is looked up, so batch jobs can `import quantum_maze` without opening a
+# window or paying for mesa at startup.
+import importlib
+
+from .maze import WALL, OPEN, START, Maze, default_goal, open_masks, move_table
+from .generators import (DIRECTIONS, GENERATORS, generate_maze, generate_maze_loops, generate_maze_kruskal,
+                         generate_maze_division, add_loops, register_generator, make_maze)
+from .rules import QuantumRules, LeftTurnRules
+from .engine import BACKENDS, SOLVERS, LiteModel, LiteQuantumPlayer, LiteLeftTurnPlayer, make_model
+from .wavefront import WavefrontModel, BidirectionalWavefrontModel
+from .mazefile import MazeFileError, save_maze, load_maze, read_header
+
+# name -> submodule that defines it; resolved on first attribute access
+_LAZY = {
+    "QuantumPlayer": "agents",
+    "LeftTurnPlayer": "agents",
+    "MazeModel": "agents",
+    # Solver add-ons, kept out of the import so it stays within its budget
+    "fill_dead_ends": "deadends",
+    "JunctionGraph": "junctions",
+    "compile_graph": "junctions",
+    "DistanceField": "distance",
+    "FieldCache": "distance",
+    "distance_field": "distance",
+    "shortest_path": "distance",
+    "IncrementalSolver": "incremental",
+}
+
+__all__ = [
+    "WALL", "OPEN", "START", "Maze", "default_goal", "open_masks", "move_table",
+    "DIRECTIONS", "GENERATORS", "generate_maze", "generate_maze_loops", "generate_maze_kruskal",
+    "generate_maze_division", "add_loops", "register_generator", "make_maze",
+    "QuantumRules", "LeftTurnRules",
+    "BACKENDS", "SOLVERS", "LiteModel", "LiteQuantumPlayer", "LiteLeftTurnPlayer", "make_model",
+    "WavefrontModel", "BidirectionalWavefrontModel",
+    "MazeFileError", "save_maze", "load_maze", "read_header",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
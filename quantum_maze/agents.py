@@ -0,0 +1,27 @@
+# mesa backend: the shared solver rules on mesa agents, MultiGrid and
+# SimultaneousActivation.
+from mesa import Agent, Model
+from mesa.time import SimultaneousActivation
+from mesa.space import MultiGrid
+
+from .rules import QuantumRules, LeftTurnRules, SolverState
+
+
+# Quantum Maze Solver Player agent
+class QuantumPlayer(QuantumRules, Agent):
+    pass
+
+
+# Left Turn First Solver Player agent
+class LeftTurnPlayer(LeftTurnRules, Agent):
+    pass
+
+
+# Maze model
+class MazeModel(SolverState, Model):
+    def __init__(self, maze, agent_type, beam_width=None, goal=None):
+        super().__init__()
+        self.init_state(maze, agent_type, beam_width, goal)
+        self.grid = MultiGrid(maze.width, maze.height, torus=False)
+        self.schedule = SimultaneousActivation(self)
+        self.add_first_agent()
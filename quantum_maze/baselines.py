@@ -0,0 +1,75 @@
+# Classical reference solvers for benchmarking: breadth-first and depth-first
+# search from maze.start to maze.goal on the 4-connected grid. Both return
+# (path, expanded), where path is a list of (x, y) cells or None and expanded
+# is the number of cells taken off the queue/stack.
+from collections import deque
+
+from .maze import OPEN
+
+
+def _neighbours(i, width, height):
+    # Same order as the solvers' neighbourhood: W, N, S, E
+    x, y = i % width, i // width
+    if x > 0:
+        yield i - 1
+    if y > 0:
+        yield i - width
+    if y < height - 1:
+        yield i + width
+    if x < width - 1:
+        yield i + 1
+
+
+def _unwind(came_from, goal, width):
+    path = []
+    i = goal
+    while i != -1:
+        path.append((i % width, i // width))
+        i = came_from[i]
+    path.reverse()
+    return path
+
+
+def bfs(maze):
+    width, height = maze.width, maze.height
+    cells = memoryview(maze.grid).cast("B")
+    start = maze.start[1] * width + maze.start[0]
+    goal = maze.goal[1] * width + maze.goal[0]
+    if cells[start] != OPEN:
+        # Same answer as DistanceField and IncrementalSolver for a walled start
+        return None, 0
+    came_from = {start: -1}
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        i = queue.popleft()
+        expanded += 1
+        if i == goal:
+            return _unwind(came_from, goal, width), expanded
+        for n in _neighbours(i, width, height):
+            if cells[n] == OPEN and n not in came_from:
+                came_from[n] = i
+                queue.append(n)
+    return None, expanded
+
+
+def dfs(maze):
+    width, height = maze.width, maze.height
+    cells = memoryview(maze.grid).cast("B")
+    start = maze.start[1] * width + maze.start[0]
+    goal = maze.goal[1] * width + maze.goal[0]
+    if cells[start] != OPEN:
+        return None, 0
+    came_from = {start: -1}
+    stack = [start]
+    expanded = 0
+    while stack:
+        i = stack.pop()
+        expanded += 1
+        if i == goal:
+            return _unwind(came_from, goal, width), expanded
+        for n in _neighbours(i, width, height):
+            if cells[n] == OPEN and n not in came_from:
+                came_from[n] = i
+                stack.append(n)
+    return None, expanded
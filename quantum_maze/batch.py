@@ -0,0 +1,153 @@
+# Batch runner: solve many mazes with many solvers across worker processes.
+#
+# Each task is one maze (generated from a per-task seed, or loaded from a maze
+# file) solved by every requested solver inside a single worker, so the maze is
+# built once and never pickled. Results stream out as tasks finish, one row
+# per solve, as JSONL or CSV.
+#
+#   python -m quantum_maze.batch --mazes 1000 --size 201 --solvers quantum bfs --workers 8 --out runs.jsonl
+#   python -m quantum_maze.batch --load mazes/*.qmaz --solvers wavefront --out runs.csv
+#
+# With --shared the parallelism is across solvers instead: each maze is built
+# once in this process, published to shared memory (quantum_maze.shared) and
+# every worker attaches to the same read-only buffer.
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .generators import GENERATORS, make_maze
+from .mazefile import load_maze
+from .runner import SOLVER_NAMES, solve
+from .shared import publish_maze, solve_attached
+
+CSV_FIELDS = ("maze", "seed", "file", "generator", "width", "height", "loops", "solver", "backend", "reached",
+              "steps", "path_length", "expanded", "peak_agents", "seconds")
+
+
+def derive_seed(base_seed, index):
+    # Independent, reproducible seed for task `index`, whatever the worker count
+    return int(np.random.SeedSequence(base_seed, spawn_key=(index,)).generate_state(1)[0])
+
+
+def make_tasks(args):
+    common = {"solvers": args.solvers, "backend": args.backend, "max_steps": args.max_steps}
+    if args.load:
+        for index, path in enumerate(args.load):
+            yield dict(common, maze=index, file=path)
+    else:
+        for index in range(args.mazes):
+            yield dict(common, maze=index, seed=derive_seed(args.seed, index), size=args.size, loops=args.loops,
+                       generator=args.generator)
+
+
+def build_task_maze(task):
+    if "file" in task:
+        maze = load_maze(task["file"])
+        meta = {"maze": task["maze"], "file": task["file"], "seed": maze.seed, "generator": maze.generator}
+    else:
+        maze = make_maze(task["generator"], task["size"], task["seed"], int(task["loops"] * task["size"]))
+        meta = {"maze": task["maze"], "seed": task["seed"], "generator": task["generator"], "loops": task["loops"]}
+    meta.update(width=maze.width, height=maze.height, backend=task["backend"])
+    return maze, meta
+
+
+def run_task(task):
+    maze, meta = build_task_maze(task)
+    rows = []
+    for solver in task["solvers"]:
+        row = dict(meta)
+        row.update(solve(maze, solver, task["backend"], task["max_steps"]))
+        rows.append(row)
+    return rows
+
+
+def run_batch(tasks, workers):
+    # Yields result rows as tasks complete; workers=0 runs in this process.
+    if workers == 0:
+        for task in tasks:
+            yield from run_task(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def run_batch_shared(tasks, workers):
+    # One maze at a time: it is built here, published to shared memory, and its
+    # solvers run in parallel on read-only views of the same buffer.
+    with ProcessPoolExecutor(max_workers=workers or 1) as pool:
+        for task in tasks:
+            maze, meta = build_task_maze(task)
+            with publish_maze(maze) as handle:
+                del maze
+                jobs = [{"solver": solver, "backend": task["backend"], "max_steps": task["max_steps"]}
+                        for solver in task["solvers"]]
+                futures = [pool.submit(solve_attached, handle, job) for job in jobs]
+                for future in as_completed(futures):
+                    row = dict(meta)
+                    row.update(future.result())
+                    del row["start"], row["goal"]
+                    yield row
+
+
+class RowWriter:
+    def __init__(self, f, fmt):
+        self.f = f
+        self.csv = csv.DictWriter(f, CSV_FIELDS, extrasaction="ignore") if fmt == "csv" else None
+        if self.csv:
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(row)
+        else:
+            self.f.write(json.dumps(row) + "\n")
+        self.f.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many mazes in parallel and stream one row per solve.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--mazes", type=int, default=100, help="number of mazes to generate")
+    source.add_argument("--load", nargs="+", metavar="FILE", help="maze files to solve instead")
+    parser.add_argument("--size", type=int, default=101)
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--loops", type=float, default=1.0, help="add_loops density, in units of maze width")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; task seeds are derived from it")
+    parser.add_argument("--solvers", nargs="+", choices=SOLVER_NAMES, default=["quantum", "leftturn"])
+    parser.add_argument("--backend", choices=("lite", "mesa"), default="lite")
+    parser.add_argument("--max-steps", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes, 0 = in-process")
+    parser.add_argument("--shared", action="store_true",
+                        help="solve one maze at a time, its solvers in parallel over a shared-memory copy")
+    parser.add_argument("--out", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="default: from --out extension, else jsonl")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.out and args.out.endswith(".csv") else "jsonl")
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    solves = 0
+    t = time.perf_counter()
+    try:
+        writer = RowWriter(out, fmt)
+        run = run_batch_shared if args.shared else run_batch
+        for row in run(make_tasks(args), args.workers):
+            writer.write(row)
+            solves += 1
+    finally:
+        if args.out:
+            out.close()
+    elapsed = time.perf_counter() - t
+    print(f"{solves} solves in {elapsed:.2f} s ({solves / elapsed:.1f}/s, {args.workers} workers)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Headless benchmarks. Each module is runnable with `python -m quantum_maze.bench.<name>`.
@@ -0,0 +1,45 @@
+# Per-step overhead of the scheduler backends.
+#
+# Runs both solvers on the mesa and the built-in ("lite") backend over the
+# same maze until the goal is reached (or --max-steps) and reports time per
+# tick. The rules are identical, so the difference is the scheduler, grid and
+# agent overhead.
+#
+#   python -m quantum_maze.bench.backends --size 201
+import argparse
+import sys
+import time
+
+from ..generators import GENERATORS, make_maze
+from ..engine import BACKENDS, SOLVERS, make_model
+
+
+def run(maze, solver, backend, max_steps):
+    model = make_model(maze, solver, backend)
+    t = time.perf_counter()
+    model.run_until_goal(max_steps)
+    return model, time.perf_counter() - t
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare scheduler backend overhead.")
+    parser.add_argument("--size", type=int, default=201)
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-steps", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    maze = make_maze(args.generator, args.size, args.seed, args.size)
+
+    print(f"{args.generator} maze {args.size} x {args.size}, seed {args.seed}")
+    print(f"{'solver':<9} {'backend':<8} {'ticks':>7} {'agents':>7} {'seconds':>8} {'us/tick':>8}")
+    for solver in SOLVERS:
+        for backend in BACKENDS:
+            model, elapsed = run(maze, solver, backend, args.max_steps)
+            ticks = model.schedule.steps
+            print(f"{solver:<9} {backend:<8} {ticks:>7} {model.current_id:>7} {elapsed:>8.3f} {elapsed / ticks * 1e6:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
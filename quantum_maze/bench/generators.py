@@ -0,0 +1,121 @@
+# Maze generator throughput and structure.
+#
+# Every registered generator is timed on the same sizes and seed, then run a
+# second time under tracemalloc for its peak memory. The structure columns
+# describe what the solvers will face: dead ends, junctions, how many corridor
+# cells run straight, the cycle rank (independent loops) and the BFS length of
+# the start-goal path.
+#
+# --stream HEIGHT also writes a width x HEIGHT Eller maze of each size straight
+# to a temporary file, which is how mazes larger than RAM are made.
+#
+#   python -m quantum_maze.bench.generators --sizes 1001 2001 4096 --seed 0 --generators dfs kruskal division
+#   python -m quantum_maze.bench.generators --sizes 4001 --stream 100000 --no-memory
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from ..generators import GENERATORS, make_maze, write_maze_eller
+from ..maze import open_masks, OPEN, DIR_W, DIR_N, DIR_S, DIR_E
+from ..distance import DistanceField
+
+
+def maze_stats(maze):
+    is_open = maze.grid == OPEN
+    masks = open_masks(maze.grid)[is_open]
+    degree = np.unpackbits(masks[:, None], axis=1).sum(axis=1)
+    cells = int(is_open.sum())
+    edges = int(degree.sum()) // 2
+    straight = (masks == DIR_W | DIR_E) | (masks == DIR_N | DIR_S)
+    field = DistanceField(maze)
+    return {
+        "open_cells": cells,
+        "dead_ends": int(np.count_nonzero(degree == 1)),
+        "junctions": int(np.count_nonzero(degree >= 3)),
+        "straight": float(np.count_nonzero(straight) / max(np.count_nonzero(degree == 2), 1)),
+        # Cycle rank of the open cells, counted as one connected component
+        "loops": edges - cells + 1 if cells else 0,
+        "reachable": field.reachable / max(cells, 1),
+        "path_length": field.distance(maze.goal),
+    }
+
+
+def bench_generator(name, size, seed, memory=True, **options):
+    t = time.perf_counter()
+    maze = make_maze(name, size, seed, **options)
+    elapsed = time.perf_counter() - t
+    row = {"generator": name, "size": size, "cells": size * size, "seconds": elapsed,
+           "cells_per_sec": size * size / elapsed, "peak_bytes": None}
+    if memory:
+        tracemalloc.start()
+        try:
+            make_maze(name, size, seed, **options)
+            row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    row.update(maze_stats(maze))
+    return row
+
+
+def bench_stream(width, height, seed, memory=True):
+    fd, path = tempfile.mkstemp(suffix=".qmaz")
+    os.close(fd)
+    try:
+        t = time.perf_counter()
+        write_maze_eller(path, width, height, seed)
+        elapsed = time.perf_counter() - t
+        row = {"width": width, "height": height, "seconds": elapsed, "cells_per_sec": width * height / elapsed,
+               "file_bytes": os.path.getsize(path), "peak_bytes": None}
+        if memory:
+            tracemalloc.start()
+            try:
+                write_maze_eller(path, width, height, seed)
+                row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    finally:
+        os.remove(path)
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure maze generation throughput, memory and structure.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1001, 2001, 4096])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--stream", type=int, metavar="HEIGHT",
+                        help="also stream a size x HEIGHT Eller maze of each size to a file")
+    args = parser.parse_args(argv)
+
+    # Throughput is also given relative to the DFS generator on the same size
+    print(f"{'generator':<10} {'size':>11} {'seconds':>8} {'Mcells/s':>9} {'vs dfs':>7} {'peak MB':>8} "
+          f"{'dead ends':>10} {'junctions':>10} {'straight':>9} {'loops':>8} {'path':>8}")
+    for size in args.sizes:
+        dfs = None
+        for name in args.generators:
+            row = bench_generator(name, size, args.seed, not args.no_memory)
+            if dfs is None:
+                dfs = row if name == "dfs" else bench_generator("dfs", size, args.seed, memory=False)
+            peak = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1e6:.1f}"
+            print(f"{row['generator']:<10} {size:>5} x {size:<5} {row['seconds']:>8.3f} {row['cells_per_sec'] / 1e6:>9.2f} "
+                  f"{row['cells_per_sec'] / dfs['cells_per_sec']:>6.2f}x {peak:>8} {row['dead_ends']:>10} "
+                  f"{row['junctions']:>10} {row['straight']:>9.2f} {row['loops']:>8} {row['path_length']!s:>8}")
+
+    if args.stream:
+        print(f"\n{'streamed':<10} {'size':>13} {'seconds':>8} {'Mcells/s':>9} {'file MB':>8} {'peak MB':>8}")
+        for size in args.sizes:
+            row = bench_stream(size, args.stream, args.seed, not args.no_memory)
+            peak = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1e6:.1f}"
+            print(f"{'eller':<10} {size:>5} x {args.stream:<7} {row['seconds']:>8.3f} "
+                  f"{row['cells_per_sec'] / 1e6:>9.2f} {row['file_bytes'] / 1e6:>8.1f} {peak:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# Incremental re-solving against solving from scratch after each wall edit.
+#
+# Each round opens or closes one random interior cell, half of them on the
+# current route so the path really has to change, then repairs the solution
+# with IncrementalSolver and counts the cells it re-expanded. A fresh solver
+# on the edited maze gives the from-scratch count.
+#
+#   python -m quantum_maze.bench.incremental --size 201 --loops 1 --edits 200
+import argparse
+import random
+import sys
+import time
+
+from ..generators import GENERATORS, make_maze
+from ..incremental import IncrementalSolver
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare incremental re-solving with solving from scratch.")
+    parser.add_argument("--size", type=int, default=201)
+    parser.add_argument("--loops", type=float, default=1.0, help="add_loops density, in units of maze width")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    maze = make_maze(args.generator, args.size, args.seed, int(args.loops * args.size))
+    rng = random.Random(args.seed)
+
+    solver = IncrementalSolver(maze)
+    path = solver.compute()
+    print(f"{args.generator} maze {args.size} x {args.size}, loops {args.loops}, seed {args.seed}: "
+          f"first solve expanded {solver.expanded} cells")
+
+    repaired = scratch = 0
+    repair_seconds = scratch_seconds = 0.0
+    for _ in range(args.edits):
+        if path and len(path) > 2 and rng.random() < 0.5:
+            solver.close_cell(path[rng.randrange(1, len(path) - 1)])
+        else:
+            pos = (rng.randrange(1, args.size - 1), rng.randrange(1, args.size - 1))
+            if maze.is_open(pos):
+                solver.close_cell(pos)
+            else:
+                solver.open_cell(pos)
+
+        t = time.perf_counter()
+        path = solver.compute()
+        repair_seconds += time.perf_counter() - t
+        repaired += solver.expanded
+
+        t = time.perf_counter()
+        fresh = IncrementalSolver(maze)
+        fresh.compute()
+        scratch_seconds += time.perf_counter() - t
+        scratch += fresh.expanded
+
+    print(f"{'':<12} {'expanded':>10} {'seconds':>9}")
+    print(f"{'incremental':<12} {repaired:>10} {repair_seconds:>9.3f}")
+    print(f"{'scratch':<12} {scratch:>10} {scratch_seconds:>9.3f}")
+    print(f"re-expanded {repaired / max(scratch, 1):.1%} of the from-scratch cells over {args.edits} edits")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
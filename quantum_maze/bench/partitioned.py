@@ -0,0 +1,42 @@
+# Time to goal of the partitioned quantum solver against its worker count.
+#
+# Loop-rich mazes keep the wavefront wide, which is where stripes pay off;
+# the single-process WavefrontModel is the baseline.
+#
+#   python -m quantum_maze.bench.partitioned --size 10001 --loops 20 --workers 1 2 4 8
+import argparse
+import os
+import sys
+import time
+
+from ..generators import GENERATORS, make_maze
+from ..partitioned import solve_partitioned
+from ..wavefront import WavefrontModel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scale the partitioned quantum solver over worker processes.")
+    parser.add_argument("--size", type=int, default=1001)
+    parser.add_argument("--loops", type=float, default=20.0, help="add_loops density, in units of maze width")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    args = parser.parse_args(argv)
+
+    maze = make_maze(args.generator, args.size, args.seed, int(args.loops * args.size))
+    print(f"{args.generator} maze {args.size} x {args.size}, loops {args.loops}, seed {args.seed}, {os.cpu_count()} cpus")
+
+    t = time.perf_counter()
+    model = WavefrontModel(maze)
+    model.run_until_goal()
+    print(f"{'wavefront':<12} {model.steps:>8} steps {time.perf_counter() - t:>8.3f} s")
+
+    for workers in args.workers:
+        t = time.perf_counter()
+        result = solve_partitioned(maze, workers)
+        print(f"{workers:>2} workers   {result['steps']:>8} steps {time.perf_counter() - t:>8.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# Reproducible solver benchmark.
+#
+# Runs every solver over a matrix of maze sizes, add_loops densities and seeds
+# and writes one JSON object per run (JSONL) so results can be diffed across
+# releases. A density of 1.0 adds `size` extra openings, like the GUI does.
+# Wall time is measured without tracing; peak memory comes from a second,
+# tracemalloc'd run of the same solve.
+#
+#   python -m quantum_maze.bench.solvers --sizes 41 81 161 --loops 0 1 --seeds 0 1 2 --out results.jsonl
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from ..generators import GENERATORS, make_maze
+from ..runner import SOLVER_NAMES, solve
+
+
+def build(size, density, seed, generator="dfs"):
+    return make_maze(generator, size, seed, int(density * size))
+
+
+def peak_memory(maze, solver, backend, max_steps, beam_width=None, fill=False):
+    tracemalloc.start()
+    try:
+        solve(maze, solver, backend, max_steps, beam_width, fill)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_matrix(sizes, densities, seeds, solvers, backend="lite", max_steps=10_000_000, memory=True, beam_width=None,
+               fill=False, generator="dfs"):
+    if backend == "mesa":
+        # Keep the one-off mesa import out of the first timing
+        importlib.import_module("quantum_maze.agents")
+    env = {"python": platform.python_version(), "machine": platform.machine(),
+           "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    for size in sizes:
+        for density in densities:
+            for seed in seeds:
+                maze = build(size, density, seed, generator)
+                for solver in solvers:
+                    row = {"generator": generator, "size": size, "loops": density, "seed": seed, "backend": backend}
+                    row.update(solve(maze, solver, backend, max_steps, beam_width, fill))
+                    row["peak_bytes"] = peak_memory(maze, solver, backend, max_steps, beam_width, fill) if memory else None
+                    row.update(env)
+                    yield row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the maze solvers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[41, 81, 161])
+    parser.add_argument("--loops", type=float, nargs="+", default=[0.0, 1.0], help="add_loops density, in units of maze width")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--solvers", nargs="+", choices=SOLVER_NAMES, default=list(SOLVER_NAMES))
+    parser.add_argument("--backend", choices=("lite", "mesa"), default="lite")
+    parser.add_argument("--max-steps", type=int, default=10_000_000)
+    parser.add_argument("--beam", type=int, help="beam mode: step only the best BEAM quantum branches per tick")
+    parser.add_argument("--fill", action="store_true", help="fill dead ends before each solve and report the pruning")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--out", help="JSONL file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = open(args.out, "w") if args.out else sys.stdout
+    try:
+        for row in run_matrix(args.sizes, args.loops, args.seeds, args.solvers, args.backend,
+                              args.max_steps, not args.no_memory, args.beam, args.fill, args.generator):
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+            if args.out:
+                print(f"{row['solver']:<9} size={row['size']:<5} loops={row['loops']:<4} seed={row['seed']:<3} "
+                      f"steps={row['steps']:<7} expanded={row['expanded']:<7} peak={row['peak_agents']:<5} "
+                      f"beam={row['beam']} pruned={row['pruned']} {row['seconds']:.3f}s", file=sys.stderr)
+    finally:
+        if args.out:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# Startup budget for the headless core.
+#
+# Every run spawns a fresh interpreter, imports numpy and then quantum_maze and
+# reports how long each import took and whether any GUI/ABM dependency came
+# along. numpy is a fixed cost that varies a lot between machines, so the
+# budget applies to the package's own import on top of it. Exits non-zero when
+# the median is over budget or a heavy module was loaded, so it can gate CI.
+#
+#   python -m quantum_maze.bench.startup --runs 20
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+STARTUP_BUDGET_MS = 50.0
+HEAVY_MODULES = ("pygame", "mesa", "matplotlib")
+
+PROBE = f"""
+import json, sys, time
+t = time.perf_counter()
+import numpy
+numpy_ms = (time.perf_counter() - t) * 1000
+t = time.perf_counter()
+import quantum_maze
+import_ms = (time.perf_counter() - t) * 1000
+print(json.dumps({{"numpy_ms": numpy_ms, "import_ms": import_ms,
+                  "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure(runs):
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", PROBE], check=True, capture_output=True, text=True).stdout
+        sample = json.loads(out)
+        sample["process_ms"] = (time.perf_counter() - t) * 1000
+        samples.append(sample)
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import cost of the headless core.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS, help="import budget in ms")
+    args = parser.parse_args(argv)
+
+    samples = measure(args.runs)
+    numpy_ms = statistics.median(s["numpy_ms"] for s in samples)
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    process_ms = statistics.median(s["process_ms"] for s in samples)
+    heavy = sorted({m for s in samples for m in s["heavy"]})
+
+    print(f"import numpy:        {numpy_ms:.1f} ms median")
+    print(f"import quantum_maze: {import_ms:.1f} ms median on top of numpy (budget {args.budget:.0f} ms)")
+    print(f"whole process:       {process_ms:.1f} ms median over {args.runs} runs")
+    if heavy:
+        print("heavy modules loaded at import:", ", ".join(heavy))
+
+    ok = import_ms <= args.budget and not heavy
+    print("OK" if ok else "OVER BUDGET")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
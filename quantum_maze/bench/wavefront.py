@@ -0,0 +1,57 @@
+# Mesa QuantumPlayer vs. the vectorized WavefrontModel, both timed to the goal.
+#
+# Two mazes of the same size: the chosen generator with add_loops, which is
+# still mostly a tree, so the frontier stays a handful of cells and NumPy's
+# per-call overhead eats most of the gain; and dfs-loops with --loop-prob,
+# where the loops keep the frontier wide and the array operations pay off.
+# Both engines take the same number of ticks; the speedup is wall time to the
+# goal.
+#
+#   python -m quantum_maze.bench.wavefront --size 1001 --loop-prob 0.3
+import argparse
+import sys
+import time
+
+from ..generators import GENERATORS, make_maze
+from ..wavefront import WavefrontModel
+
+
+def time_to_goal(model, max_steps):
+    t = time.perf_counter()
+    model.run_until_goal(max_steps)
+    return time.perf_counter() - t
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the mesa and vectorized quantum engines.")
+    parser.add_argument("--size", type=int, default=1001)
+    parser.add_argument("--generator", choices=list(GENERATORS), default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--loop-prob", type=float, default=0.3, help="loop_prob of the loop-rich dfs-loops maze")
+    parser.add_argument("--max-steps", type=int, default=10_000_000)
+    args = parser.parse_args(argv)
+
+    from .. import agents
+
+    mazes = [
+        (f"{args.generator}+loops", make_maze(args.generator, args.size, args.seed, args.size)),
+        (f"dfs-loops p={args.loop_prob}", make_maze("dfs-loops", args.size, args.seed, loop_prob=args.loop_prob)),
+    ]
+    print(f"maze {args.size} x {args.size}, seed {args.seed}, timed to the goal")
+    print(f"{'maze':<16} {'ticks':>7} {'mean front':>10} {'mesa s':>8} {'wave s':>8} {'speedup':>8}")
+    for name, maze in mazes:
+        mesa_model = agents.MazeModel(maze, agents.QuantumPlayer)
+        mesa_s = time_to_goal(mesa_model, args.max_steps)
+
+        wave = WavefrontModel(maze)
+        wave_s = time_to_goal(wave, args.max_steps)
+
+        if mesa_model.goal_step != wave.steps:
+            print(f"{name}: tick counts differ, mesa {mesa_model.goal_step} vs wavefront {wave.steps}")
+        front = wave.expanded / max(wave.steps, 1)
+        print(f"{name:<16} {wave.steps:>7} {front:>10.1f} {mesa_s:>8.3f} {wave_s:>8.3f} {mesa_s / wave_s:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# Dead-end filling pre-pass.
+#
+# An open cell with at most one open neighbour (three or four walls) can only
+# lie on a start-goal path if it is the start or the goal itself, so it can be
+# walled up without changing which routes exist. Filling one dead end can turn
+# its neighbour into a new one, so the pass repeats until nothing changes.
+#
+# The first round counts the open neighbours of every cell at once. Later
+# rounds only look at the neighbours of the cells filled in the previous one,
+# so a whole corridor is filled in O(its length) work, not O(maze size) per
+# cell of it. Once only a few corridors are still shrinking, a round costs more
+# in NumPy call overhead than in work, and a plain worklist finishes them.
+# Cells are flat indices into the grid padded with a wall border, like the
+# wavefront engine.
+import numpy as np
+
+from .maze import OPEN, WALL
+
+# Below this many candidates a round is cheaper cell by cell in Python
+_SCALAR_BELOW = 256
+
+
+def fill_dead_ends(maze):
+    # Returns (reduced, pruned): a copy of maze with the dead ends walled up
+    # and the number of cells that were filled. start and goal stay open.
+    width, height = maze.width, maze.height
+    stride = width + 2
+    offsets = np.array([-1, -stride, stride, 1], dtype=np.intp)
+
+    padded = np.zeros((height + 2, stride), dtype=bool)
+    padded[1:-1, 1:-1] = maze.grid == OPEN
+    is_open = padded.ravel()
+    keep = np.zeros(is_open.size, dtype=bool)
+    for x, y in (maze.start, maze.goal):
+        if 0 <= x < width and 0 <= y < height:
+            keep[(y + 1) * stride + x + 1] = True
+
+    candidates = np.flatnonzero(is_open)
+    pruned = 0
+    while candidates.size >= _SCALAR_BELOW:
+        candidates = candidates[is_open[candidates] & ~keep[candidates]]
+        counts = is_open[candidates[:, None] + offsets].sum(axis=1)
+        dead = candidates[counts <= 1]
+        is_open[dead] = False
+        pruned += dead.size
+        candidates = np.unique((dead[:, None] + offsets).ravel())
+
+    if candidates.size:
+        cells = bytearray(is_open.tobytes())
+        kept = set(np.flatnonzero(keep).tolist())
+        steps = offsets.tolist()
+        stack = candidates.tolist()
+        while stack:
+            i = stack.pop()
+            if not cells[i] or i in kept:
+                continue
+            around = [i + d for d in steps if cells[i + d]]
+            if len(around) <= 1:
+                cells[i] = 0
+                pruned += 1
+                stack.extend(around)
+        is_open[:] = np.frombuffer(cells, dtype=bool)
+
+    reduced = maze.copy()
+    reduced.grid[~padded[1:-1, 1:-1] & (reduced.grid == OPEN)] = WALL
+    return reduced, pruned
@@ -0,0 +1,175 @@
+# Single-source distance fields for repeated goal queries.
+#
+# A DistanceField is one breadth-first sweep from a start cell over the whole
+# maze, kept as two int32 arrays: the BFS distance of every cell (-1 where the
+# start cannot reach) and the flat index of the cell it was reached from. After
+# that, the distance to any goal is a single lookup and the path to it a walk
+# of its own length.
+#
+# distance_field() keeps the most recently used fields in an LRU cache keyed by
+# a hash of the maze contents and the start, so a changed maze never gets a
+# stale field. The hash is remembered per maze until Maze.version moves on
+# (open_cell/close_cell, or Maze.changed() after writing the grid directly),
+# so a cached query only reads the grid again after an edit.
+import hashlib
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from .maze import OPEN
+
+# Below this many cells a BFS layer is cheaper cell by cell in Python
+_SCALAR_BELOW = 64
+
+
+# maze -> (version, grid, key) from the last maze_key() on it
+_keys = weakref.WeakKeyDictionary()
+
+
+def maze_key(maze):
+    # Content hash of the grid, independent of the Maze object and its goal
+    known = _keys.get(maze)
+    if known is not None and known[0] == maze.version and known[1] is maze.grid:
+        return known[2]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.array([maze.width, maze.height], dtype=np.int64).tobytes())
+    h.update(np.ascontiguousarray(maze.grid).data)
+    key = h.digest()
+    _keys[maze] = (maze.version, maze.grid, key)
+    return key
+
+
+class DistanceField:
+    def __init__(self, maze, start=None):
+        self.width, self.height = maze.width, maze.height
+        self.start = maze.start if start is None else tuple(start)
+        stride = self.width + 2
+        offsets = np.array([-1, -stride, stride, 1], dtype=np.intp)
+
+        # Same padded flat layout as the wavefront engine while sweeping
+        free = np.zeros((self.height + 2, stride), dtype=bool)
+        free[1:-1, 1:-1] = maze.grid == OPEN
+        free = free.ravel()
+        dist = np.full(free.size, -1, dtype=np.int32)
+        parent = np.full(free.size, -1, dtype=np.intp)
+
+        x, y = self.start
+        if 0 <= x < self.width and 0 <= y < self.height and free[(y + 1) * stride + x + 1]:
+            frontier = np.array([(y + 1) * stride + x + 1], dtype=np.intp)
+            free[frontier] = False
+            dist[frontier] = 0
+        else:
+            frontier = np.empty(0, dtype=np.intp)
+        # Wide layers advance with array operations. Narrow ones, which is
+        # most of them in a maze without loops, go cell by cell through
+        # memoryviews, where NumPy's per-call overhead would dominate.
+        free_view = memoryview(free.view(np.uint8))
+        dist_view = memoryview(dist)
+        parent_view = memoryview(parent)
+        steps = offsets.tolist()
+        d = 0
+        while frontier.size:
+            d += 1
+            if frontier.size < _SCALAR_BELOW:
+                layer = []
+                for i in frontier.tolist():
+                    for offset in steps:
+                        n = i + offset
+                        if free_view[n]:
+                            free_view[n] = 0
+                            dist_view[n] = d
+                            parent_view[n] = i
+                            layer.append(n)
+                frontier = np.array(layer, dtype=np.intp)
+                continue
+            cand = (frontier[:, None] + offsets).ravel()
+            src = np.repeat(frontier, 4)
+            ok = free[cand]
+            cand, src = cand[ok], src[ok]
+            parent[cand] = src
+            mine = parent[cand] == src
+            cand = cand[mine]
+            free[cand] = False
+            dist[cand] = d
+            frontier = cand
+
+        # Drop the padding: unpadded flat indices, -1 for no predecessor
+        dist = dist.reshape(self.height + 2, stride)[1:-1, 1:-1]
+        parent = parent.reshape(self.height + 2, stride)[1:-1, 1:-1]
+        py, px = np.divmod(parent, stride)
+        self.dist = dist.ravel()
+        self.parent = np.where(parent >= 0, (py - 1) * self.width + px - 1, -1).astype(np.int32).ravel()
+        self.reachable = int(np.count_nonzero(self.dist >= 0))
+
+    @property
+    def nbytes(self):
+        return self.dist.nbytes + self.parent.nbytes
+
+    def distance(self, goal):
+        # Moves from the start to goal, or None if it cannot be reached
+        x, y = goal
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        d = int(self.dist[y * self.width + x])
+        return None if d < 0 else d
+
+    def path_to(self, goal):
+        # Shortest path from the start to goal as (x, y) cells, or None
+        if self.distance(goal) is None:
+            return None
+        width = self.width
+        parent = memoryview(self.parent)
+        i = goal[1] * width + goal[0]
+        path = []
+        while i != -1:
+            path.append((i % width, i // width))
+            i = parent[i]
+        path.reverse()
+        return path
+
+    def __repr__(self):
+        return f"DistanceField({self.width}x{self.height}, start={self.start}, reachable={self.reachable})"
+
+
+class FieldCache:
+    # Least recently used DistanceFields, keyed by (maze_key, start)
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self.fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, maze, start=None):
+        start = maze.start if start is None else tuple(start)
+        key = (maze_key(maze), start)
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = DistanceField(maze, start)
+        self.fields[key] = field
+        while len(self.fields) > self.maxsize:
+            self.fields.popitem(last=False)
+        return field
+
+    def clear(self):
+        self.fields.clear()
+
+    def __len__(self):
+        return len(self.fields)
+
+
+_cache = FieldCache()
+
+
+def distance_field(maze, start=None):
+    # Cached DistanceField for maze from start (default maze.start)
+    return _cache.get(maze, start)
+
+
+def shortest_path(maze, goal=None, start=None):
+    # Shortest path from start to goal (defaults: the maze's own), or None
+    return distance_field(maze, start).path_to(maze.goal if goal is None else goal)
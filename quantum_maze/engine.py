@@ -0,0 +1,102 @@
+# Built-in scheduler backend.
+#
+# MazeModel pays for mesa's MultiGrid, AgentSet bookkeeping and full Agent
+# objects, although the solvers only ever need a single-occupancy grid walk.
+# LiteModel runs the same rules (quantum_maze.rules) on __slots__ agents, a
+# flat occupancy array and an insertion-ordered schedule, without importing
+# mesa. make_model() picks a backend by name.
+from .rules import QuantumRules, LeftTurnRules, SolverState
+
+BACKENDS = ("lite", "mesa")
+SOLVERS = ("quantum", "leftturn")
+
+
+class LiteAgent:
+    __slots__ = ("unique_id", "model", "pos")
+
+    def __init__(self, unique_id, model):
+        self.unique_id = unique_id
+        self.model = model
+        self.pos = None
+
+
+class LiteQuantumPlayer(QuantumRules, LiteAgent):
+    __slots__ = ()
+
+
+class LiteLeftTurnPlayer(LeftTurnRules, LiteAgent):
+    __slots__ = ("stack", "visited")
+
+
+class FlatGrid:
+    # The subset of mesa's MultiGrid the rules use, over one byte per cell
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.occupancy = bytearray(width * height)
+
+    def place_agent(self, agent, pos):
+        self.occupancy[pos[1] * self.width + pos[0]] += 1
+        agent.pos = pos
+
+    def remove_agent(self, agent):
+        pos = agent.pos
+        self.occupancy[pos[1] * self.width + pos[0]] -= 1
+        agent.pos = None
+
+    def move_agent(self, agent, pos):
+        self.remove_agent(agent)
+        self.place_agent(agent, pos)
+
+
+class LiteSchedule:
+    # Steps agents in insertion order. Agents added during a tick first run on
+    # the next one, like mesa's schedulers.
+    def __init__(self):
+        self._agents = {}
+        self.steps = 0
+
+    @property
+    def agents(self):
+        return list(self._agents)
+
+    def get_agent_count(self):
+        return len(self._agents)
+
+    def add(self, agent):
+        self._agents[agent] = None
+
+    def remove(self, agent):
+        del self._agents[agent]
+
+    def step(self):
+        agents = self._agents
+        for agent in list(agents):
+            if agent in agents:
+                agent.step()
+        self.steps += 1
+
+
+class LiteModel(SolverState):
+    def __init__(self, maze, agent_type, beam_width=None, goal=None):
+        self.init_state(maze, agent_type, beam_width, goal)
+        self.grid = FlatGrid(maze.width, maze.height)
+        self.schedule = LiteSchedule()
+        self.add_first_agent()
+
+
+def make_model(maze, solver="quantum", backend="lite", beam_width=None, goal=None):
+    # beam_width caps how many quantum branches step per tick (see SolverState);
+    # goal defaults to maze.goal
+    if backend == "lite":
+        model_type, players = LiteModel, {"quantum": LiteQuantumPlayer, "leftturn": LiteLeftTurnPlayer}
+    elif backend == "mesa":
+        from .agents import MazeModel, QuantumPlayer, LeftTurnPlayer
+        model_type, players = MazeModel, {"quantum": QuantumPlayer, "leftturn": LeftTurnPlayer}
+    else:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {BACKENDS}")
+    if solver not in players:
+        raise ValueError(f"unknown solver {solver!r}, expected one of {SOLVERS}")
+    if beam_width is not None and (solver != "quantum" or beam_width < 1):
+        raise ValueError("beam_width needs the quantum solver and must be at least 1")
+    return model_type(maze, players[solver], beam_width, goal)
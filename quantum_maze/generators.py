@@ -0,0 +1,329 @@
+import itertools
+import random
+from array import array
+
+import numpy as np
+
+from .maze import OPEN, WALL, Maze
+from .mazefile import write_rows
+
+# Directions for DFS: right, down, left, up (in terms of grid movement)
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+def make_rng(seed=None, rng=None):
+    # Every generator takes either a seed or its own random.Random instance and
+    # never touches the module-level `random` state.
+    if rng is not None:
+        return rng
+    return random.Random(seed)
+
+
+def generate_maze(maze, x=1, y=1, seed=None, rng=None):
+    # Recursive backtracker with an explicit stack, so the depth is bounded by
+    # memory rather than the interpreter's recursion limit. Each cell still
+    # tries its four directions in a random order and carves into the first
+    # unvisited one, exactly like the old recursive version.
+    rng = make_rng(seed, rng)
+    grid, cols, rows = maze.grid, maze.width, maze.height
+    maze.generator, maze.seed = "dfs", seed
+    maze.changed()
+
+    # Cells the carver may still enter: same parity as the start, strictly
+    # inside the border and still a wall. Border rows/columns are never set, so
+    # stepping off an edge (which wraps in flat indexing) always lands on a 0;
+    # the padding covers stepping two rows past the bottom.
+    todo = np.zeros((rows, cols), dtype=np.uint8)
+    todo[1 + (y - 1) % 2:rows - 1:2, 1 + (x - 1) % 2:cols - 1:2] = 1
+    todo &= grid == WALL
+    todo = bytearray(todo.tobytes() + bytes(2 * cols + 2))
+
+    cells = memoryview(grid).cast("B")
+    perms = [tuple(dx + dy * cols for dx, dy in p) for p in itertools.permutations(DIRECTIONS)]
+    n_perms = len(perms)
+    choose = rng.random
+
+    start = y * cols + x
+    cells[start] = OPEN
+    todo[start] = 0
+    stack = [(start, iter(perms[int(choose() * n_perms)]))]
+    push, pop = stack.append, stack.pop
+    while stack:
+        cell, dirs = stack[-1]
+        for d in dirs:
+            nxt = cell + 2 * d
+            if todo[nxt]:
+                todo[nxt] = 0
+                cells[cell + d] = OPEN
+                cells[nxt] = OPEN
+                push((nxt, iter(perms[int(choose() * n_perms)])))
+                break
+        else:
+            pop()
+
+
+def generate_maze_kruskal(maze, x=1, y=1, seed=None, rng=None):
+    # Randomized Kruskal on the same lattice the DFS carver uses (cells with
+    # the parity of (x, y), inside the border). Every wall between two lattice
+    # neighbours is an edge; the edges are shuffled once as a NumPy array and
+    # a wall is knocked down whenever it joins two different trees. The
+    # union-find is flat: parent is an int array over lattice indices, find
+    # halves paths iteratively and union goes by rank.
+    rng = make_rng(seed, rng)
+    grid, cols, rows = maze.grid, maze.width, maze.height
+    maze.generator, maze.seed = "kruskal", seed
+    maze.changed()
+
+    xs = np.arange(1 + (x - 1) % 2, cols - 1, 2)
+    ys = np.arange(1 + (y - 1) % 2, rows - 1, 2)
+    nx, ny = xs.size, ys.size
+    if nx == 0 or ny == 0:
+        return
+    grid[np.ix_(ys, xs)] = OPEN
+
+    # Edge e = 2 * k + d joins lattice cell k to its east (d = 0) or south
+    # (d = 1) neighbour
+    dtype = np.int32 if 2 * nx * ny < 2 ** 31 else np.int64
+    k = np.arange(nx * ny, dtype=dtype).reshape(ny, nx)
+    edges = np.concatenate((2 * k[:, :-1].ravel(), 2 * k[:-1, :].ravel() + 1))
+    edges = np.random.default_rng(rng.getrandbits(64)).permutation(edges)
+
+    parent = array("q", range(nx * ny))
+    rank = bytearray(nx * ny)
+    carved = np.zeros(edges.size, dtype=bool)
+    unions = nx * ny - 1
+    step = (1, nx)
+    chunk = 1 << 16
+    for first in range(0, edges.size, chunk):
+        if not unions:
+            break
+        for j, e in enumerate(edges[first:first + chunk].tolist(), first):
+            a = e >> 1
+            b = a + step[e & 1]
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+            carved[j] = True
+            unions -= 1
+            if not unions:
+                break
+
+    # Open the wall cell between the two lattice cells of every carved edge
+    e = edges[carved]
+    k, d = e >> 1, e & 1
+    grid[ys[k // nx] + d, xs[k % nx] + 1 - d] = OPEN
+
+
+def generate_maze_division(maze, x=1, y=1, seed=None, rng=None):
+    # Recursive division with an explicit stack of chambers. It starts from an
+    # empty room over the same lattice the other generators use and splits
+    # every chamber at least two lattice cells in both directions with one
+    # wall across it: a single slice assignment on the grid, then one cell
+    # reopened as the passage. The wall runs across the longer side; it is
+    # picked at random for square chambers. The result is a perfect maze with
+    # long straight corridors.
+    rng = make_rng(seed, rng)
+    grid, cols, rows = maze.grid, maze.width, maze.height
+    maze.generator, maze.seed = "division", seed
+    maze.changed()
+
+    x0, y0 = 1 + (x - 1) % 2, 1 + (y - 1) % 2
+    nx, ny = (cols - 1 - x0 + 1) // 2, (rows - 1 - y0 + 1) // 2
+    if nx <= 0 or ny <= 0:
+        return
+    grid[y0:y0 + 2 * ny - 1, x0:x0 + 2 * nx - 1] = OPEN
+
+    # Chambers are (i, j, w, h) in lattice cells; lattice cell (i, j) is grid
+    # cell (x0 + 2 * i, y0 + 2 * j)
+    choose = rng.random
+    stack = [(0, 0, nx, ny)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        i, j, w, h = pop()
+        if w < 2 or h < 2:
+            continue
+        left, top = x0 + 2 * i, y0 + 2 * j
+        if h > w or (h == w and choose() < 0.5):
+            # Horizontal wall below lattice row j + k, passage in column i + p
+            k = int(choose() * (h - 1))
+            p = int(choose() * w)
+            wy = top + 2 * k + 1
+            grid[wy, left:left + 2 * w - 1] = WALL
+            grid[wy, left + 2 * p] = OPEN
+            push((i, j, w, k + 1))
+            push((i, j + k + 1, w, h - k - 1))
+        else:
+            k = int(choose() * (w - 1))
+            p = int(choose() * h)
+            wx = left + 2 * k + 1
+            grid[top:top + 2 * h - 1, wx] = WALL
+            grid[top + 2 * p, wx] = OPEN
+            push((i, j, k + 1, h))
+            push((i + k + 1, j, w - k - 1, h))
+
+
+def generate_maze_loops(maze, x=1, y=1, seed=None, rng=None, loop_prob=0.1):
+    # DFS backtracker, then every wall left standing between two lattice
+    # cells is knocked down with probability loop_prob, which braids the
+    # perfect maze into one with loops all over it.
+    rng = make_rng(seed, rng)
+    generate_maze(maze, x, y, seed, rng)
+    maze.generator = "dfs-loops"
+    grid, cols, rows = maze.grid, maze.width, maze.height
+    x0, y0 = 1 + (x - 1) % 2, 1 + (y - 1) % 2
+
+    # Walls between horizontal neighbours sit on lattice rows at odd offsets
+    # from x0, walls between vertical neighbours on lattice columns
+    between = np.zeros((rows, cols), dtype=bool)
+    between[y0:rows - 1:2, x0 + 1:cols - 2:2] = True
+    between[y0 + 1:rows - 2:2, x0:cols - 1:2] = True
+    walls = np.flatnonzero(between.ravel() & (grid.ravel() == WALL))
+    coin = np.random.default_rng(rng.getrandbits(64)).random(walls.size)
+    grid.ravel()[walls[coin < loop_prob]] = OPEN
+
+
+def _eller_rows(width, height, x=1, y=1, rng=None):
+    # Eller's algorithm, one grid row at a time. The only state carried from
+    # row to row is the set label of each lattice cell in the current row, so
+    # memory is O(width) whatever the height. Per lattice row: join
+    # neighbouring cells of different sets at random (a small union-find over
+    # that row's labels keeps it loop-free), give every set at least one
+    # opening down, and start fresh sets under the cells that did not open.
+    # The last row joins everything still apart.
+    x0, y0 = 1 + (x - 1) % 2, 1 + (y - 1) % 2
+    nx, ny = (width - x0) // 2, (height - y0) // 2
+    wall = np.full(width, WALL, dtype=np.uint8)
+    if nx <= 0 or ny <= 0:
+        for _ in range(height):
+            yield wall
+        return
+
+    gen = np.random.default_rng(rng.getrandbits(64))
+    cols = x0 + 2 * np.arange(nx)
+    labels = np.arange(nx)
+    for _ in range(y0):
+        yield wall
+    for j in range(ny):
+        last = j == ny - 1
+        coin = np.ones(nx - 1, dtype=bool) if last else gen.random(nx - 1) < 0.5
+        _, labels = np.unique(labels, return_inverse=True)
+        parent = list(range(nx))
+        lab = labels.tolist()
+        joined = []
+        for i in np.flatnonzero(coin & (labels[:-1] != labels[1:])).tolist():
+            a, b = lab[i], lab[i + 1]
+            while parent[a] != a:
+                parent[a] = a = parent[parent[a]]
+            while parent[b] != b:
+                parent[b] = b = parent[parent[b]]
+            if a != b:
+                parent[b] = a
+                joined.append(i)
+        roots = np.array(parent)
+        while True:
+            jumped = roots[roots]
+            if (jumped == roots).all():
+                break
+            roots = jumped
+        labels = roots[labels]
+
+        row = wall.copy()
+        row[cols] = OPEN
+        row[cols[joined] + 1] = OPEN
+        yield row
+        if last:
+            break
+
+        down = gen.random(nx) < 0.5
+        has_down = np.zeros(nx, dtype=bool)
+        has_down[labels[down]] = True
+        missing = np.flatnonzero(~has_down[labels])
+        if missing.size:
+            # A random member of every set without an opening goes down
+            order = missing[np.lexsort((gen.random(missing.size), labels[missing]))]
+            first = np.ones(order.size, dtype=bool)
+            first[1:] = labels[order[1:]] != labels[order[:-1]]
+            down[order[first]] = True
+        below = wall.copy()
+        below[cols[down]] = OPEN
+        yield below
+        fresh = np.flatnonzero(~down)
+        labels[fresh] = nx + np.arange(fresh.size)
+    for _ in range(height - y0 - 2 * ny + 1):
+        yield wall
+
+
+def generate_maze_eller(maze, x=1, y=1, seed=None, rng=None):
+    # Eller's algorithm into an in-memory maze; write_maze_eller() streams the
+    # same rows to a file instead
+    rng = make_rng(seed, rng)
+    maze.generator, maze.seed = "eller", seed
+    maze.changed()
+    for row_y, row in enumerate(_eller_rows(maze.width, maze.height, x, y, rng)):
+        maze.grid[row_y] = row
+
+
+def write_maze_eller(path, width, height, seed=None, rng=None, encoding="bits"):
+    # Generates a width x height maze straight into a maze file, row by row,
+    # with memory independent of the height. Load it with mazefile.load_maze
+    # (encoding="bytes" gives a memmap, so it can be solved out of core too).
+    rng = make_rng(seed, rng)
+    write_rows(path, width, height, _eller_rows(width, height, 1, 1, rng),
+               encoding=encoding, generator="eller", seed=seed)
+
+
+def add_loops(maze, extra_loops=10, seed=None, rng=None):
+    rng = make_rng(seed, rng)
+    grid, cols, rows = maze.grid, maze.width, maze.height
+    if maze.generator:
+        maze.generator += "+loops"
+    maze.changed()
+    for _ in range(extra_loops):
+        x = rng.randint(1, cols - 3)
+        y = rng.randint(1, rows - 3)
+        if grid[y, x] == WALL:
+            grid[y, x] = OPEN
+        else:
+            extra_loops -= 1
+
+
+# Named generators behind one signature: f(maze, x=1, y=1, seed=None,
+# rng=None, **options) carves maze in place. make_maze() is the usual way in.
+GENERATORS = {
+    "dfs": generate_maze,
+    "dfs-loops": generate_maze_loops,
+    "kruskal": generate_maze_kruskal,
+    "division": generate_maze_division,
+    "eller": generate_maze_eller,
+}
+
+
+def register_generator(name, func):
+    GENERATORS[name] = func
+    return func
+
+
+def make_maze(generator="dfs", size=41, seed=None, loops=0, **options):
+    # A new Maze of size (int, or (width, height)) carved by the named
+    # generator; loops > 0 runs add_loops afterwards on the same random
+    # stream, so the loops do not replay the choices that carved the maze.
+    # options go to the generator, e.g. loop_prob for "dfs-loops".
+    if generator not in GENERATORS:
+        raise ValueError(f"unknown generator {generator!r}, expected one of {tuple(GENERATORS)}")
+    width, height = (size, size) if isinstance(size, int) else size
+    maze = Maze(width, height)
+    rng = make_rng(seed)
+    GENERATORS[generator](maze, seed=seed, rng=rng, **options)
+    if loops:
+        add_loops(maze, loops, rng=rng)
+    return maze
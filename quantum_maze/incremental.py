@@ -0,0 +1,162 @@
+# Incremental shortest paths while walls open and close (LPA*).
+#
+# IncrementalSolver keeps, for every cell, its current distance estimate g and
+# the one-step lookahead rhs (the best g of an open neighbour, plus one). A
+# cell whose g and rhs disagree is queued, ordered by its estimate plus the
+# Manhattan distance to the goal. compute() settles queued cells until the
+# goal is consistent. After an edit only the edited cell and its neighbours
+# are queued again, so the next compute() repairs just the part of the
+# previous search that the edit can affect instead of starting over.
+#
+# Edits go through open_cell()/close_cell() here, which change the maze and
+# queue the cells around it. Code that writes maze.grid directly must call
+# cell_changed() for every cell it touched.
+from heapq import heappush, heappop
+
+from .maze import OPEN
+
+INF = float("inf")
+
+
+class IncrementalSolver:
+    def __init__(self, maze, start=None, goal=None):
+        self.maze = maze
+        self.width, self.height = maze.width, maze.height
+        self.start = maze.start if start is None else tuple(start)
+        self.goal = maze.goal if goal is None else tuple(goal)
+        # A live view, so edits made through the maze are seen here
+        self.cells = memoryview(maze.grid).cast("B")
+        n = self.width * self.height
+        self.g = [INF] * n
+        self.rhs = [INF] * n
+        self.queue = []
+        self.queued = {}  # cell -> key it is queued under; stale heap entries are skipped
+        self.expanded = 0  # cells settled by the last compute()
+        self.total_expanded = 0
+        self.edits = 0
+
+        self.start_index = self._index(self.start)
+        self.goal_index = self._index(self.goal)
+        if self.start_index is not None:
+            self.rhs[self.start_index] = 0
+            self._push(self.start_index)
+
+    def _index(self, pos):
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def _neighbours(self, i):
+        # Same order as the solvers' neighbourhood: W, N, S, E
+        width = self.width
+        x, y = i % width, i // width
+        if x > 0:
+            yield i - 1
+        if y > 0:
+            yield i - width
+        if y < self.height - 1:
+            yield i + width
+        if x < width - 1:
+            yield i + 1
+
+    def _key(self, i):
+        best = min(self.g[i], self.rhs[i])
+        x, y = i % self.width, i // self.width
+        gx, gy = self.goal
+        return (best + abs(x - gx) + abs(y - gy), best)
+
+    def _push(self, i):
+        key = self._key(i)
+        self.queued[i] = key
+        heappush(self.queue, (key, i))
+
+    def _update(self, i):
+        # Recompute rhs of cell i and (re)queue it if it is inconsistent
+        if i != self.start_index:
+            best = INF
+            cells = self.cells
+            if cells[i] == OPEN:
+                g = self.g
+                for n in self._neighbours(i):
+                    if cells[n] == OPEN and g[n] + 1 < best:
+                        best = g[n] + 1
+            self.rhs[i] = best
+        elif self.cells[i] != OPEN:
+            self.rhs[i] = INF
+        else:
+            self.rhs[i] = 0
+        if self.g[i] != self.rhs[i]:
+            self._push(i)
+        else:
+            self.queued.pop(i, None)
+
+    def _top(self):
+        # Smallest live key in the queue, dropping stale entries
+        queue, queued = self.queue, self.queued
+        while queue:
+            key, i = queue[0]
+            if queued.get(i) == key:
+                return key
+            heappop(queue)
+        return (INF, INF)
+
+    def compute(self):
+        # Repair the search until the goal's distance is final; returns the path
+        self.expanded = 0
+        goal = self.goal_index
+        if goal is None or self.start_index is None:
+            return None
+        g, rhs, queued = self.g, self.rhs, self.queued
+        while self._top() < self._key(goal) or rhs[goal] != g[goal]:
+            if not self.queue:
+                break
+            _, u = heappop(self.queue)
+            del queued[u]
+            self.expanded += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+                for n in self._neighbours(u):
+                    self._update(n)
+            else:
+                g[u] = INF
+                self._update(u)
+                for n in self._neighbours(u):
+                    self._update(n)
+        self.total_expanded += self.expanded
+        return self.path()
+
+    def path(self):
+        # Shortest path from the current g values, or None
+        g, cells = self.g, self.cells
+        i = self.goal_index
+        if i is None or g[i] == INF:
+            return None
+        width = self.width
+        path = [(i % width, i // width)]
+        while i != self.start_index:
+            # Walls may still hold a stale g, they are never a way through
+            i = min((n for n in self._neighbours(i) if cells[n] == OPEN), key=g.__getitem__)
+            path.append((i % width, i // width))
+        path.reverse()
+        return path
+
+    def cell_changed(self, pos):
+        # Queue the cells whose rhs may depend on pos after it was edited
+        i = self._index(pos)
+        self.edits += 1
+        self._update(i)
+        for n in self._neighbours(i):
+            self._update(n)
+
+    def open_cell(self, pos):
+        if self.maze.open_cell(pos):
+            self.cell_changed(pos)
+            return True
+        return False
+
+    def close_cell(self, pos):
+        if self.maze.close_cell(pos):
+            self.cell_changed(pos)
+            return True
+        return False
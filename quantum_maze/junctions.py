@@ -0,0 +1,263 @@
+# Junction graph: the maze with its corridors collapsed.
+#
+# Most open cells of a generated maze have exactly two open neighbours, so a
+# solver standing on one has nothing to decide. JunctionGraph keeps only the
+# other cells (junctions, dead ends) plus start and goal as nodes, and turns
+# each corridor between two of them into one weighted edge that remembers its
+# cells. The solvers below walk the graph and expand their answer back into
+# the cell path at the end; they report the same step counts as the cell
+# solvers they mirror.
+#
+# Cells are flat indices into the grid padded with a wall border, like the
+# wavefront engine. Isolated loops without any junction never touch a node
+# and are left out.
+from array import array
+from heapq import heappush, heappop
+
+import numpy as np
+
+from .maze import OPEN
+
+
+class JunctionGraph:
+    def __init__(self, maze):
+        self.maze = maze
+        self.stride = stride = maze.width + 2
+        offsets = np.array([-1, -stride, stride, 1], dtype=np.intp)  # W, N, S, E
+
+        padded = np.zeros((maze.height + 2, stride), dtype=bool)
+        padded[1:-1, 1:-1] = maze.grid == OPEN
+        is_open = padded.ravel()
+        cells = np.flatnonzero(is_open)
+        around = is_open[cells[:, None] + offsets]
+        degree = around.sum(axis=1)
+        self.open_cells = int(cells.size)
+
+        is_node = np.zeros(is_open.size, dtype=bool)
+        is_node[cells[degree != 2]] = True
+        self.start = self._endpoint(maze.start, is_open, is_node)
+        self.goal = self._endpoint(maze.goal, is_open, is_node)
+
+        # Both open neighbours of every corridor cell, for the tracing walk
+        corridor = cells[degree == 2]
+        pair = around[degree == 2]
+        first = np.full(is_open.size, -1, dtype=np.intp)
+        last = np.full(is_open.size, -1, dtype=np.intp)
+        first[corridor] = corridor + offsets[pair.argmax(axis=1)]
+        last[corridor] = corridor + offsets[3 - pair[:, ::-1].argmax(axis=1)]
+
+        # nodes[k] is the flat index of node k; edges[e] is (a, b, length, cells)
+        # with the corridor cells strictly between a and b in order from a.
+        # adj[k] lists (edge, other node) in W, N, S, E order of the exit.
+        self.nodes = np.flatnonzero(is_node).tolist()
+        self.node_id = {i: k for k, i in enumerate(self.nodes)}
+        self.edges = []
+        self.adj = [[] for _ in self.nodes]
+        self._trace(is_open, is_node, offsets.tolist(), first.tolist(), last.tolist())
+
+    def _endpoint(self, pos, is_open, is_node):
+        # start and goal are always nodes, when they are open cells at all
+        x, y = pos
+        if not (0 <= x < self.maze.width and 0 <= y < self.maze.height):
+            return None
+        i = (y + 1) * self.stride + x + 1
+        if not is_open[i]:
+            return None
+        is_node[i] = True
+        return i
+
+    def _trace(self, is_open, is_node, offsets, first, last):
+        node_id, adj = self.node_id, self.adj
+        is_open = is_open.tolist()
+        is_node = is_node.tolist()
+        exits = [[] for _ in self.nodes]
+        done = set()
+        for a, i in enumerate(self.nodes):
+            for d, offset in enumerate(offsets):
+                if not is_open[i + offset] or (i, offset) in done:
+                    continue
+                prev, cur = i, i + offset
+                cells = array("q")
+                while not is_node[cur]:
+                    cells.append(cur)
+                    nxt = first[cur]
+                    if nxt == prev:
+                        nxt = last[cur]
+                    prev, cur = cur, nxt
+                b = node_id[cur]
+                back = prev - cur
+                done.add((cur, back))
+                e = len(self.edges)
+                self.edges.append((a, b, len(cells) + 1, cells))
+                exits[a].append((d, e, b))
+                exits[b].append((offsets.index(back), e, a))
+        for k, found in enumerate(exits):
+            found.sort()
+            adj[k] = [(e, other) for _, e, other in found]
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    @property
+    def edge_count(self):
+        return len(self.edges)
+
+    def position(self, index):
+        y, x = divmod(int(index), self.stride)
+        return (x - 1, y - 1)
+
+    def expand(self, start, hops):
+        # Cell path for a walk from node `start` along hops, a list of
+        # (edge, node it was entered from)
+        path = [self.position(self.nodes[start])]
+        for e, came in hops:
+            a, b, _, cells = self.edges[e]
+            if came == a:
+                middle, end = cells, b
+            else:
+                middle, end = reversed(cells), a
+            path.extend(self.position(i) for i in middle)
+            path.append(self.position(self.nodes[end]))
+        return path
+
+    def _unwind(self, parent, node):
+        hops = []
+        while parent[node] is not None:
+            e, came = parent[node]
+            hops.append((e, came))
+            node = came
+        hops.reverse()
+        return hops
+
+    def __repr__(self):
+        return f"JunctionGraph({self.node_count} nodes, {self.edge_count} edges, {self.open_cells} open cells)"
+
+
+def compile_graph(maze):
+    return JunctionGraph(maze)
+
+
+def bfs(graph):
+    # Uniform-cost search, the weighted-edge equivalent of BFS on cells.
+    # Returns (path, expanded) like baselines.bfs; expanded counts nodes.
+    if graph.start is None or graph.goal is None:
+        return None, 0
+    start, goal = graph.node_id[graph.start], graph.node_id[graph.goal]
+    dist = {start: 0}
+    parent = {start: None}
+    heap = [(0, start)]
+    done = set()
+    while heap:
+        d, u = heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == goal:
+            return graph.expand(start, graph._unwind(parent, u)), len(done)
+        for e, v in graph.adj[u]:
+            nd = d + graph.edges[e][2]
+            if v not in dist or nd < dist[v]:
+                dist[v] = nd
+                parent[v] = (e, u)
+                heappush(heap, (nd, v))
+    return None, len(done)
+
+
+def quantum(graph, max_steps=None):
+    # The quantum solver on edges: a branch leaving a node at tick t reaches
+    # the far end of an edge of length L at t + L, unless another branch got
+    # there first. A node is claimed by the first arrival, so ticks equal cell
+    # distance, as in WavefrontModel. Returns (path, steps, expanded cells,
+    # peak branches in flight).
+    if graph.start is None:
+        return None, 0, 0, 0
+    edges, adj = graph.edges, graph.adj
+    start = graph.node_id[graph.start]
+    goal = None if graph.goal is None else graph.node_id[graph.goal]
+    dist = {}
+    parent = {}
+    heap = [(0, start, None)]
+    peak = 1
+    reached_at = None
+    while heap:
+        t, u, via = heappop(heap)
+        if reached_at is not None and t > reached_at:
+            break
+        if max_steps is not None and t > max_steps:
+            break
+        if u in dist:
+            continue  # beaten to this node: the branch dies in the corridor
+        dist[u] = t
+        parent[u] = via
+        if u == goal:
+            reached_at = t
+        for e, v in adj[u]:
+            if v not in dist:
+                heappush(heap, (t + edges[e][2], v, (e, u)))
+        peak = max(peak, len(heap))
+
+    # Cells claimed up to the last tick: settled nodes plus the corridor
+    # cells k = 1 .. length - 1 within reach of either end, i.e. with
+    # da + k <= horizon or db + length - k <= horizon
+    horizon = reached_at if reached_at is not None else max_steps
+    expanded = len(dist)
+    for a, b, length, _ in edges:
+        da, db = dist.get(a), dist.get(b)
+        if da is None and db is None:
+            continue
+        if horizon is None:
+            expanded += length - 1
+            continue
+        near = 0 if da is None else min(length - 1, horizon - da)
+        far = length if db is None else max(1, length - (horizon - db))
+        if near >= far - 1:
+            expanded += length - 1
+        else:
+            expanded += max(near, 0) + length - far
+    if reached_at is None:
+        return None, max(dist.values()), expanded, peak
+    return graph.expand(start, graph._unwind(parent, goal)), reached_at, expanded, peak
+
+
+def wall_follow(graph, max_steps=None):
+    # LeftTurnRules on edges: take the first unused exit in W, N, S, E order,
+    # back out of corridors that lead to an already visited node and retrace
+    # the last edge at a dead end. Steps count cell moves, like the cell
+    # walker. Returns (path, steps, expanded cells).
+    if graph.start is None:
+        return None, 0, 0
+    edges, adj = graph.edges, graph.adj
+    start = graph.node_id[graph.start]
+    goal = None if graph.goal is None else graph.node_id[graph.goal]
+    visited = {start}
+    used = set()
+    stack = []
+    u = start
+    steps = 0
+    expanded = 1
+    while u != goal and (max_steps is None or steps < max_steps):
+        for e, v in adj[u]:
+            if e in used:
+                continue
+            used.add(e)
+            length = edges[e][2]
+            expanded += length - 1
+            if v in visited:
+                # Walk in to the last corridor cell, find it blocked, walk back
+                steps += 2 * (length - 1)
+                continue
+            visited.add(v)
+            expanded += 1
+            steps += length
+            stack.append((e, u))
+            u = v
+            break
+        else:
+            if not stack:
+                return None, steps, expanded
+            e, u = stack.pop()
+            steps += edges[e][2]
+    if u != goal:
+        return None, steps, expanded
+    return graph.expand(start, stack), steps, expanded
@@ -0,0 +1,116 @@
+# Maze grid.
+# The grid is a contiguous (height, width) uint8 array: grid[y, x] is 1 for a
+# wall and 0 for an open cell. Positions are (x, y) tuples, the same convention
+# the mesa grid uses.
+import numpy as np
+
+WALL = 1
+OPEN = 0
+
+START = (1, 1)
+
+# Bits of an open-direction mask, in the solvers' neighbour order W, N, S, E
+DIR_W, DIR_N, DIR_S, DIR_E = 1, 2, 4, 8
+
+
+def default_goal(cols, rows):
+    # Bottom-right cell the DFS generator carves from START: (cols - 3, rows - 3)
+    # for even sizes, one further out for odd ones, where those cells are walls.
+    return (cols - 3 + cols % 2, rows - 3 + rows % 2)
+
+
+def open_masks(grid):
+    # uint8 array shaped like grid: bit DIR_* is set when the neighbour in that
+    # direction is an open cell inside the grid
+    is_open = grid == OPEN
+    masks = np.zeros(grid.shape, dtype=np.uint8)
+    masks[:, 1:] |= is_open[:, :-1] * np.uint8(DIR_W)
+    masks[1:, :] |= is_open[:-1, :] * np.uint8(DIR_N)
+    masks[:-1, :] |= is_open[1:, :] * np.uint8(DIR_S)
+    masks[:, :-1] |= is_open[:, 1:] * np.uint8(DIR_E)
+    return masks
+
+
+def move_table(width):
+    # moves[mask] lists (flat offset, dx, dy) for every direction set in mask,
+    # in W, N, S, E order, for a grid `width` cells wide
+    steps = ((-1, -1, 0), (-width, 0, -1), (width, 0, 1), (1, 1, 0))
+    return [tuple(steps[k] for k in range(4) if mask >> k & 1) for mask in range(16)]
+
+
+class Maze:
+    def __init__(self, width, height, start=START, goal=None, grid=None):
+        self.width = width
+        self.height = height
+        self.start = tuple(start)
+        self.goal = default_goal(width, height) if goal is None else tuple(goal)
+        if grid is None:
+            # Maze grid (initialized with walls)
+            grid = np.full((height, width), WALL, dtype=np.uint8)
+        if grid.shape != (height, width) or grid.dtype != np.uint8:
+            raise ValueError(f"grid must be a ({height}, {width}) uint8 array, got {grid.shape} {grid.dtype}")
+        self.grid = grid
+        # How the maze was made, set by the generators and kept by mazefile
+        self.generator = None
+        self.seed = None
+        # Bumped on every edit made through the Maze. Code that writes grid
+        # directly calls changed(), so caches keyed on the contents notice.
+        self.version = 0
+        # (version, grid, masks) from the last masks() call
+        self._masks = None
+
+    @classmethod
+    def from_rows(cls, rows, start=START, goal=None):
+        # Build a maze from the old list-of-lists layout (rows[y][x]).
+        grid = np.array(rows, dtype=np.uint8)
+        height, width = grid.shape
+        return cls(width, height, start, goal, grid)
+
+    @property
+    def nbytes(self):
+        return self.grid.nbytes
+
+    def is_open(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height and self.grid[y, x] == OPEN
+
+    def open_cell(self, pos):
+        # Edit API; True if the cell changed. Solvers that keep state across
+        # edits (quantum_maze.incremental) wrap these to hear about them.
+        return self._set_cell(pos, OPEN)
+
+    def close_cell(self, pos):
+        return self._set_cell(pos, WALL)
+
+    def _set_cell(self, pos, value):
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"cell {pos} is outside the {self.width}x{self.height} maze")
+        if self.grid[y, x] == value:
+            return False
+        self.grid[y, x] = value
+        self.version += 1
+        return True
+
+    def changed(self):
+        # Call after writing self.grid directly
+        self.version += 1
+
+    def masks(self):
+        # open_masks() of the grid, shared by every model built on this maze
+        # and only recomputed after it changed
+        known = self._masks
+        if known is None or known[0] != self.version or known[1] is not self.grid:
+            known = self._masks = (self.version, self.grid, open_masks(self.grid))
+        return known[2]
+
+    def copy(self):
+        maze = Maze(self.width, self.height, self.start, self.goal, self.grid.copy())
+        maze.generator, maze.seed = self.generator, self.seed
+        return maze
+
+    def to_rows(self):
+        return self.grid.tolist()
+
+    def __repr__(self):
+        return f"Maze({self.width}x{self.height}, start={self.start}, goal={self.goal})"
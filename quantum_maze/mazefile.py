@@ -0,0 +1,147 @@
+# Versioned on-disk maze format.
+#
+# A file is a fixed little-endian header, the generator name, zero padding up
+# to a 64-byte boundary and then the cell payload, row by row:
+#
+#   magic    4s  b"QMAZ"
+#   version  H   FORMAT_VERSION
+#   encoding B   ENCODING_BITS (np.packbits per row, ceil(width / 8) bytes per
+#                row, 1 = wall) or ENCODING_BYTES (one uint8 per cell)
+#   -        B   reserved
+#   width, height, start x/y, goal x/y   6 x Q
+#   seed     q   -1 if unknown
+#   name_len H   followed by that many bytes of UTF-8 generator name
+#
+# Bit-packed files are 8x smaller; load_maze() unpacks them into RAM. Byte
+# files are opened with numpy.memmap straight into Maze.grid, so a solver can
+# start on a maze far larger than RAM and the OS pages cells in on demand.
+import struct
+
+import numpy as np
+
+from .maze import Maze, START, default_goal
+
+MAGIC = b"QMAZ"
+FORMAT_VERSION = 1
+ENCODING_BITS = 0
+ENCODING_BYTES = 1
+ENCODINGS = {"bits": ENCODING_BITS, "bytes": ENCODING_BYTES}
+
+_HEADER = struct.Struct("<4sHBB6QqH")
+_ALIGN = 64
+_CHUNK_ROWS = 4096  # rows packed/unpacked at a time, bounds temporary memory
+_CHUNK_BYTES = 1 << 22  # cap on a write_rows() buffer, whatever the width
+
+
+class MazeFileError(ValueError):
+    pass
+
+
+def _payload_offset(name_len):
+    return -(-(_HEADER.size + name_len) // _ALIGN) * _ALIGN
+
+
+def row_bytes(width, encoding):
+    return -(-width // 8) if encoding == ENCODING_BITS else width
+
+
+def _check_seed(seed):
+    # The header stores the seed as an int64, with -1 for "unknown"
+    if seed is not None and not (isinstance(seed, int) and 0 <= seed < 2 ** 63):
+        raise ValueError(f"seed {seed!r} cannot be stored in a maze file, it must be an int in [0, 2**63)")
+
+
+def write_header(f, width, height, start, goal, encoding="bits", generator=None, seed=None):
+    # Writes the header and padding; the caller then writes the payload rows.
+    _check_seed(seed)
+    name = (generator or "").encode("utf-8")
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, ENCODINGS[encoding], 0, width, height,
+                          start[0], start[1], goal[0], goal[1],
+                          -1 if seed is None else seed, len(name))
+    f.write(header + name)
+    f.write(bytes(_payload_offset(len(name)) - len(header) - len(name)))
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size or raw[:4] != MAGIC:
+            raise MazeFileError(f"{path}: not a maze file")
+        magic, version, encoding, _, width, height, sx, sy, gx, gy, seed, name_len = _HEADER.unpack(raw)
+        if version != FORMAT_VERSION:
+            raise MazeFileError(f"{path}: unsupported format version {version}")
+        if encoding not in (ENCODING_BITS, ENCODING_BYTES):
+            raise MazeFileError(f"{path}: unknown encoding {encoding}")
+        name = f.read(name_len).decode("utf-8")
+    return {
+        "version": version,
+        "encoding": "bits" if encoding == ENCODING_BITS else "bytes",
+        "width": width,
+        "height": height,
+        "start": (sx, sy),
+        "goal": (gx, gy),
+        "seed": None if seed < 0 else seed,
+        "generator": name or None,
+        "offset": _payload_offset(name_len),
+    }
+
+
+def save_maze(maze, path, encoding="bits"):
+    if encoding not in ENCODINGS:
+        raise ValueError(f"unknown encoding {encoding!r}, expected one of {tuple(ENCODINGS)}")
+    _check_seed(maze.seed)
+    with open(path, "wb") as f:
+        write_header(f, maze.width, maze.height, maze.start, maze.goal, encoding, maze.generator, maze.seed)
+        for y in range(0, maze.height, _CHUNK_ROWS):
+            rows = maze.grid[y:y + _CHUNK_ROWS]
+            f.write((np.packbits(rows, axis=1) if encoding == "bits" else np.ascontiguousarray(rows)).tobytes())
+
+
+def write_rows(path, width, height, rows, start=START, goal=None, encoding="bits", generator=None, seed=None):
+    # Streams an iterable of `height` uint8 rows (1 = wall) into a new maze
+    # file. Only a few MB of rows are buffered, so the maze never has to fit
+    # in memory.
+    if encoding not in ENCODINGS:
+        raise ValueError(f"unknown encoding {encoding!r}, expected one of {tuple(ENCODINGS)}")
+    _check_seed(seed)
+    goal = default_goal(width, height) if goal is None else goal
+    chunk = max(1, min(_CHUNK_ROWS, _CHUNK_BYTES // max(width, 1)))
+    buf = np.empty((chunk, width), dtype=np.uint8)
+    written = 0
+    with open(path, "wb") as f:
+        write_header(f, width, height, start, goal, encoding, generator, seed)
+        n = 0
+        for row in rows:
+            buf[n] = row
+            n += 1
+            if n == chunk or written + n == height:
+                f.write((np.packbits(buf[:n], axis=1) if encoding == "bits" else buf[:n]).tobytes())
+                written += n
+                n = 0
+    if written != height or n:
+        raise ValueError(f"expected {height} rows, got {written + n}")
+
+
+def open_payload(path, mode="r"):
+    # The raw payload as a (height, row_bytes) memmap, without decoding it.
+    header = read_header(path)
+    encoding = ENCODINGS[header["encoding"]]
+    shape = (header["height"], row_bytes(header["width"], encoding))
+    return header, np.memmap(path, dtype=np.uint8, mode=mode, offset=header["offset"], shape=shape)
+
+
+def load_maze(path, mmap=True, mode="r"):
+    # mmap applies to byte-encoded files: the grid is then a memmap over the
+    # file (read-only unless mode="r+"). Bit-packed files are always unpacked.
+    header, payload = open_payload(path, mode if mmap else "r")
+    width, height = header["width"], header["height"]
+    if header["encoding"] == "bytes":
+        grid = payload if mmap else np.array(payload)
+    else:
+        grid = np.empty((height, width), dtype=np.uint8)
+        for y in range(0, height, _CHUNK_ROWS):
+            grid[y:y + _CHUNK_ROWS] = np.unpackbits(payload[y:y + _CHUNK_ROWS], axis=1, count=width)
+        del payload
+    maze = Maze(width, height, header["start"], header["goal"], grid)
+    maze.generator, maze.seed = header["generator"], header["seed"]
+    return maze
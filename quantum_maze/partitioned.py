@@ -0,0 +1,166 @@
+# Multi-process quantum wavefront for a single huge maze.
+#
+# The maze is cut into horizontal stripes, one per worker process. Every tick
+# each worker advances the branches inside its stripe exactly like
+# WavefrontModel.step(), claims the cells that fall inside its stripe and
+# posts the ones that cross a stripe edge to its neighbour's mailbox. After a
+# barrier each worker claims the cells posted to it, publishes its frontier
+# size and whether it holds the goal, and after a second barrier everybody
+# agrees on whether to stop. The frontier is still one BFS layer per tick, so
+# the step count matches MazeModel(maze, QuantumPlayer) and WavefrontModel.
+#
+# All shared state lives in multiprocessing.shared_memory:
+#   state   one uint8 per cell of the padded grid: WALL_STATE, FREE_STATE, or
+#           the direction (index into offsets) the cell was claimed from. It is
+#           both the visited bitmap and the predecessor array. A worker only
+#           ever writes cells of its own stripe.
+#   mail    int64[workers, 2, width + 2]: cells crossing the top / bottom edge
+#   status  int64[workers, STATUS_FIELDS]
+from multiprocessing import get_context, shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from .maze import OPEN
+
+WALL_STATE = 254
+FREE_STATE = 255
+START_STATE = 4
+
+# status columns
+UP, DOWN, FRONTIER, GOAL, EXPANDED, STEPS = range(6)
+STATUS_FIELDS = 6
+
+
+def _stripes(height, workers):
+    # Padded row ranges [y0, y1) covering real rows 1..height
+    bounds = np.linspace(1, height + 1, workers + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _worker(index, names, shape, stripes, start, goal, max_steps, barrier):
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        height, stride = shape
+        workers = len(stripes)
+        state = np.ndarray(height * stride, dtype=np.uint8, buffer=blocks[0].buf)
+        mail = np.ndarray((workers, 2, stride), dtype=np.int64, buffer=blocks[1].buf)
+        status = np.ndarray((workers, STATUS_FIELDS), dtype=np.int64, buffer=blocks[2].buf)
+        _run_stripe(index, state, mail, status, stride, stripes, start, goal, max_steps, barrier)
+    except BrokenBarrierError:
+        pass
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        # drop the views before closing the blocks they point into
+        state = mail = status = None
+        for block in blocks:
+            block.close()
+
+
+def _run_stripe(index, state, mail, status, stride, stripes, start, goal, max_steps, barrier):
+    y0, y1 = stripes[index]
+    offsets = np.array([-1, -stride, stride, 1], dtype=np.int64)
+    dirs4 = np.arange(4, dtype=np.uint8)
+    has_goal = y0 <= goal // stride < y1
+    frontier = np.array([start] if y0 <= start // stride < y1 else [], dtype=np.int64)
+    steps = 0
+
+    while True:
+        # Phase A: advance local branches, post edge crossings
+        cand = (frontier[:, None] + offsets).ravel()
+        dirs = np.tile(dirs4, frontier.size)
+        ok = state[cand] == FREE_STATE
+        cand, dirs = cand[ok], dirs[ok]
+        rows = cand // stride
+        inside = (rows >= y0) & (rows < y1)
+        up, down = cand[rows < y0], cand[rows >= y1]
+        local, local_dirs = cand[inside], dirs[inside]
+        # A cell reached from two branches is claimed by whichever direction
+        # was written last; the direction identifies the parent uniquely.
+        state[local] = local_dirs
+        local = local[state[local] == local_dirs]
+        mail[index, 0, :up.size] = up
+        mail[index, 1, :down.size] = down
+        status[index, UP], status[index, DOWN] = up.size, down.size
+        barrier.wait()
+
+        # Phase B: claim what the neighbours posted into this stripe
+        new = [local]
+        if index > 0:
+            cells = mail[index - 1, 1, :status[index - 1, DOWN]]
+            cells = cells[state[cells] == FREE_STATE]
+            state[cells] = 2  # reached going down
+            new.append(cells)
+        if index < len(stripes) - 1:
+            cells = mail[index + 1, 0, :status[index + 1, UP]]
+            cells = cells[state[cells] == FREE_STATE]
+            state[cells] = 1  # reached going up
+            new.append(cells)
+        frontier = np.concatenate(new)
+        steps += 1
+        status[index, FRONTIER] = frontier.size
+        status[index, EXPANDED] += frontier.size
+        status[index, STEPS] = steps
+        status[index, GOAL] = has_goal and state[goal] <= START_STATE
+        barrier.wait()
+
+        # Phase C: everyone reads the same status, so everyone stops together
+        if status[:, GOAL].any() or not status[:, FRONTIER].any() or steps >= max_steps:
+            return
+
+
+def solve_partitioned(maze, workers=2, max_steps=10_000_000):
+    # Returns {"steps", "expanded", "reached", "path", "workers"}
+    height, stride = maze.height + 2, maze.width + 2
+    workers = max(1, min(workers, maze.height))
+    start = (maze.start[1] + 1) * stride + maze.start[0] + 1
+    goal = (maze.goal[1] + 1) * stride + maze.goal[0] + 1
+    offsets = np.array([-1, -stride, stride, 1], dtype=np.int64)
+
+    sizes = (height * stride, workers * 2 * stride * 8, workers * STATUS_FIELDS * 8)
+    blocks = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+    try:
+        state = np.ndarray(height * stride, dtype=np.uint8, buffer=blocks[0].buf)
+        grid = state.reshape(height, stride)
+        grid[:] = WALL_STATE
+        grid[1:-1, 1:-1][maze.grid == OPEN] = FREE_STATE
+        state[start] = START_STATE
+        status = np.ndarray((workers, STATUS_FIELDS), dtype=np.int64, buffer=blocks[2].buf)
+        status[:] = 0
+
+        if start == goal:
+            steps, reached = 0, True
+        else:
+            ctx = get_context()
+            barrier = ctx.Barrier(workers)
+            names = [block.name for block in blocks]
+            procs = [ctx.Process(target=_worker, args=(i, names, (height, stride), _stripes(maze.height, workers),
+                                                       start, goal, max_steps, barrier))
+                     for i in range(workers)]
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+            if any(proc.exitcode for proc in procs):
+                raise RuntimeError("partitioned solver worker failed")
+            steps, reached = int(status[0, STEPS]), bool(status[:, GOAL].any())
+
+        path = None
+        if reached:
+            path = []
+            i = goal
+            while state[i] != START_STATE:
+                path.append((i % stride - 1, i // stride - 1))
+                i -= offsets[state[i]]
+            path.append(maze.start)
+            path.reverse()
+        result = {"steps": steps, "expanded": 1 + int(status[:, EXPANDED].sum()), "reached": reached,
+                  "path": path, "workers": workers}
+    finally:
+        state = grid = status = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return result
@@ -0,0 +1,131 @@
+import numpy as np
+import pygame
+
+from .maze import OPEN
+from .rules import QuantumRules, LeftTurnRules
+
+CELL_SIZE = 10  # Size of each cell in the maze
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+LIGHTGREY = (200, 200, 200)
+DARKGREY = (150, 150, 150)
+PURPLE = (128, 0, 128)
+
+
+def cell_rect(pos):
+    return pygame.Rect(pos[0] * CELL_SIZE, pos[1] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+
+def trail_color(agent_type):
+    if issubclass(agent_type, QuantumRules):
+        return BLUE
+    if issubclass(agent_type, LeftTurnRules):
+        return YELLOW
+    return GREEN
+
+
+# Draws the maze area incrementally.
+#
+# The static maze (walls, open cells, exit) is rendered once into a cached
+# background surface and only rebuilt by set_maze(). Trails go onto a
+# persistent transparent layer as agents reach new cells. Each frame only the
+# cells the agents left and the cells they now occupy are redrawn, and draw()
+# returns those rectangles so the caller can pass them to
+# pygame.display.update() instead of flipping the whole screen.
+class MazeRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.maze = None
+        self.background = None
+        self.trails = None
+        self.player_rects = []
+        self.full_redraw = True
+
+    def set_maze(self, maze, model=None):
+        # "New Maze": the only thing that invalidates the background
+        self.maze = maze
+        colors = np.array([BLACK, WHITE], dtype=np.uint8)
+        small = pygame.surfarray.make_surface(colors[(maze.grid.T == OPEN).astype(np.intp)])
+        size = (maze.width * CELL_SIZE, maze.height * CELL_SIZE)
+        self.background = pygame.transform.scale(small, size).convert()
+        self.background.fill(RED, cell_rect(maze.goal))
+        self.reset(model)
+
+    def reset(self, model=None):
+        # New model on the same maze: drop the trails, keep the background.
+        # The first draw() comes after the first step, when the start agent
+        # has already moved on, so its cell goes onto the trail layer here.
+        size = self.background.get_size()
+        self.trails = pygame.Surface(size, pygame.SRCALPHA)
+        if model is not None:
+            pygame.draw.rect(self.trails, trail_color(model.agent_type), cell_rect(self.maze.start), 1)
+        self.player_rects = []
+        self.full_redraw = True
+
+    def draw(self, model):
+        screen = self.screen
+        if self.full_redraw:
+            screen.blit(self.background, (0, 0))
+            # The trail layer may already hold the start cell from reset()
+            screen.blit(self.trails, (0, 0))
+            dirty = [self.background.get_rect()]
+        else:
+            # Restore the cells the players stood on last frame
+            for rect in self.player_rects:
+                screen.blit(self.background, rect, rect)
+                screen.blit(self.trails, rect, rect)
+            dirty = list(self.player_rects)
+
+        color = trail_color(model.agent_type)
+
+        # Every cell a player stands on is part of its trail, so drawing the
+        # current positions onto the trail layer keeps it complete as long as
+        # the model advances one tick per frame.
+        self.player_rects = []
+        for agent in model.schedule.agents:
+            rect = cell_rect(agent.pos)
+            pygame.draw.rect(self.trails, color, rect, 1)
+            screen.fill(GREEN, rect)
+            self.player_rects.append(rect)
+        dirty.extend(self.player_rects)
+
+        self.full_redraw = False
+        return dirty
+
+
+# Function to draw buttons with borders
+def draw_button(screen, text, x, y, w, h, active):
+    if active:
+        color = DARKGREY
+    else:
+        color = LIGHTGREY
+    pygame.draw.rect(screen, color, (x, y, w, h))  # Inner button
+    font = pygame.font.Font(None, 36)
+    text_surf = font.render(text, True, BLACK)
+    text_rect = text_surf.get_rect(center=(x + w // 2, y + h // 2))
+    screen.blit(text_surf, text_rect)
+
+# Function to display instructions
+def draw_instructions(screen, x, y):
+    font = pygame.font.Font(None, 28)
+    instructions = [
+        "Select Solver:",
+        "1. Quantum Solver",
+        "2. Left Turn Solver",
+        "3. Pause/Resume"
+    ]
+    for i, line in enumerate(instructions):
+        text_surf = font.render(line, True, WHITE)
+        screen.blit(text_surf, (x, y + i * 30))
+
+# Function to draw the timer
+def draw_timer(screen, time_elapsed):
+    font = pygame.font.Font(None, 36)
+    text_surf = font.render(f"Time: {time_elapsed:.3f} s", True, WHITE)
+    screen.blit(text_surf, (10, screen.get_height() - 40))
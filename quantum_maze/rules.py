@@ -0,0 +1,221 @@
+# Solver rules shared by every scheduler backend.
+#
+# The classes here only talk to `self.model.grid`, `self.model.schedule` and
+# the SolverState helpers, so the same step() runs on mesa (quantum_maze.agents)
+# and on the built-in engine (quantum_maze.engine). They declare empty
+# __slots__ so the built-in engine's agents can stay dict-free.
+#
+# Moves come from the model's per-cell open-direction masks: one lookup gives
+# the open neighbours of a cell as (flat offset, dx, dy) entries, so a step
+# never builds a neighbourhood list or indexes the grid.
+from array import array
+from heapq import heappush, heappop
+
+from .maze import move_table
+
+
+# Quantum Maze Solver rules
+class QuantumRules:
+    __slots__ = ()
+
+    def __init__(self, unique_id, model, pos, came_from=None):
+        # pos is set by grid.place_agent(); mesa warns if it is already set
+        super().__init__(unique_id, model)
+        model.visit(pos, came_from)
+
+    @property
+    def path(self):
+        return self.model.path_to(self.pos)
+
+    def step(self):
+        model = self.model
+        x, y = self.pos
+        i = y * model.maze.width + x
+        visited = model.visited
+        # Cells on this branch's own path are marked in the model's bitmap too,
+        # and so is every cell a branch stands on
+        possible_steps = [m for m in model.moves[model.masks[i]] if not visited[i + m[0]]]
+
+        if possible_steps:
+            if len(possible_steps) > 1:
+                for _, dx, dy in possible_steps:
+                    step = (x + dx, y + dy)
+                    new_agent = type(self)(model.next_id(), model, step, self.pos)
+                    model.schedule.add(new_agent)
+                    model.grid.place_agent(new_agent, step)
+                    if step == model.goal:
+                        model.arrive(new_agent)
+                model.grid.remove_agent(self)
+                model.schedule.remove(self)
+            else:
+                _, dx, dy = possible_steps[0]
+                new_pos = (x + dx, y + dy)
+                model.visit(new_pos, self.pos)
+                model.grid.move_agent(self, new_pos)
+                if new_pos == model.goal:
+                    model.arrive(self)
+        else:
+            # Dead end: this branch will never move again
+            self.model.retire(self)
+
+
+# Left Turn First Solver rules
+class LeftTurnRules:
+    __slots__ = ()
+
+    def __init__(self, unique_id, model, pos, came_from=None):
+        super().__init__(unique_id, model)
+        self.stack = [pos]
+        # Flat indices (y * width + x) of every cell this walker has been on
+        self.visited = {pos[1] * model.maze.width + pos[0]}
+
+    @property
+    def path(self):
+        return list(self.stack)
+
+    def step(self):
+        model = self.model
+        # The single walker stays on the goal once model.arrive() recorded it
+        if model.goal_reached:
+            return
+
+        x, y = self.pos
+        i = y * model.maze.width + x
+        for offset, dx, dy in model.moves[model.masks[i]]:
+            if i + offset not in self.visited:
+                new_pos = (x + dx, y + dy)
+                self.stack.append(new_pos)
+                self.visited.add(i + offset)
+                model.grid.move_agent(self, new_pos)
+                if new_pos == model.goal:
+                    model.arrive(self)
+                break
+        else:
+            if len(self.stack) > 1:
+                self.stack.pop()
+                new_pos = self.stack[-1]
+                model.grid.move_agent(self, new_pos)
+            else:
+                # Back at the start with every cell tried: the walker is done
+                model.retire(self)
+
+
+# Model-side bookkeeping shared by MazeModel and LiteModel
+class SolverState:
+    def init_state(self, maze, agent_type, beam_width=None, goal=None):
+        self.maze = maze
+        self.goal = maze.goal if goal is None else tuple(goal)
+        self.current_id = 0
+        self.agent_type = agent_type
+        # Cells claimed by any QuantumPlayer branch, one byte per cell, and the
+        # flat index of the cell each one was reached from (-1 for the start)
+        self.visited = bytearray(maze.width * maze.height)
+        # Open-direction mask of every cell (flat) and the moves for each mask
+        self.masks = memoryview(maze.masks()).cast("B")
+        self.moves = move_table(maze.width)
+        n = maze.width * maze.height
+        self.came_from = array("i" if n < 2 ** 31 else "q", [-1]) * n
+        # Path length from the start to every visited cell; only beam mode
+        # ranks branches by it, so other models skip the extra 4 bytes a cell
+        self.depth = array("i", [0]) * n if beam_width is not None else None
+        # Flat cell index of every branch that died in a dead end. The branch
+        # itself leaves the schedule and the grid, its trail stays in `visited`.
+        self.retired = array("q")
+        # Beam mode: only the beam_width best branches (path length plus
+        # Manhattan distance to the goal) step each tick. The others wait in
+        # the `parked` heap as (score, unique_id, agent), still on the grid.
+        self.beam_width = beam_width
+        self.parked = []
+        # Filled in by arrive() the moment a branch lands on the goal: the
+        # tick it happened on, the branch and its path from the start
+        self.tick = 0
+        self.goal_reached = False
+        self.goal_step = None
+        self.winner = None
+        self.goal_path = None
+
+    def add_first_agent(self):
+        a = self.agent_type(self.next_id(), self, self.maze.start)
+        self.schedule.add(a)
+        self.grid.place_agent(a, self.maze.start)
+        if a.pos == self.goal:
+            self.arrive(a)
+
+    def arrive(self, agent):
+        # Called by the rules when a branch moves onto the goal; the first
+        # arrival wins
+        if not self.goal_reached:
+            self.goal_reached = True
+            self.goal_step = self.tick
+            self.winner = agent
+            self.goal_path = agent.path
+
+    def next_id(self):
+        self.current_id += 1
+        return self.current_id
+
+    def is_visited(self, pos):
+        return self.visited[pos[1] * self.maze.width + pos[0]]
+
+    def visit(self, pos, came_from=None):
+        # Test-and-set: True if pos had not been visited before
+        width = self.maze.width
+        i = pos[1] * width + pos[0]
+        if self.visited[i]:
+            return False
+        self.visited[i] = 1
+        if came_from is not None:
+            j = came_from[1] * width + came_from[0]
+            self.came_from[i] = j
+            if self.depth is not None:
+                self.depth[i] = self.depth[j] + 1
+        return True
+
+    def retire(self, agent):
+        self.retired.append(agent.pos[1] * self.maze.width + agent.pos[0])
+        self.grid.remove_agent(agent)
+        self.schedule.remove(agent)
+
+    def path_to(self, pos):
+        # Walk the predecessor chain back to the start; None if pos is unvisited
+        width = self.maze.width
+        i = pos[1] * width + pos[0]
+        if not self.visited[i]:
+            return None
+        path = []
+        while i != -1:
+            path.append((i % width, i // width))
+            i = self.came_from[i]
+        path.reverse()
+        return path
+
+    @property
+    def alive(self):
+        # True while any branch can still move, scheduled or parked
+        return self.schedule.get_agent_count() > 0 or len(self.parked) > 0
+
+    def select_beam(self):
+        # Park every scheduled branch, then bring back the best beam_width
+        width = self.maze.width
+        gx, gy = self.goal
+        depth, parked, schedule = self.depth, self.parked, self.schedule
+        for agent in list(schedule.agents):
+            schedule.remove(agent)
+            x, y = agent.pos
+            heappush(parked, (depth[y * width + x] + abs(x - gx) + abs(y - gy), agent.unique_id, agent))
+        for _ in range(min(self.beam_width, len(parked))):
+            schedule.add(heappop(parked)[2])
+
+    def step(self):
+        self.tick = self.schedule.steps + 1
+        if self.beam_width is not None:
+            self.select_beam()
+        self.schedule.step()
+
+    def run_until_goal(self, max_steps=None):
+        # Step until a branch reaches the goal or none can move; True if reached
+        while not self.goal_reached and self.alive:
+            if max_steps is not None and self.schedule.steps >= max_steps:
+                break
+            self.step()
+        return self.goal_reached
@@ -0,0 +1,104 @@
+# Headless solve of one maze with any solver, returning plain metrics.
+import time
+
+from .baselines import bfs, dfs
+from .deadends import fill_dead_ends
+from . import junctions
+from .engine import make_model
+from .wavefront import WavefrontModel, BidirectionalWavefrontModel
+
+SOLVER_NAMES = ("quantum", "leftturn", "wavefront", "bidirectional", "bfs", "dfs",
+                "graph-quantum", "graph-leftturn", "graph-bfs")
+
+
+def _run_model(maze, solver, backend, max_steps, beam_width=None):
+    model = make_model(maze, solver, backend, beam_width)
+    schedule = model.schedule
+    walker = schedule.agents[0]
+    peak_agents = 1
+    peak_parked = 0
+    while not model.goal_reached and model.alive and schedule.steps < max_steps:
+        model.step()
+        peak_agents = max(peak_agents, schedule.get_agent_count())
+        peak_parked = max(peak_parked, len(model.parked))
+
+    if solver == "quantum":
+        expanded = model.visited.count(1)
+    else:
+        expanded = len(walker.visited)
+    return {"steps": schedule.steps, "expanded": expanded, "path": model.goal_path, "peak_agents": peak_agents,
+            "peak_parked": peak_parked}
+
+
+def _run_wavefront(maze, model_type, max_steps):
+    model = model_type(maze)
+    peak_agents = 1
+    while not model.goal_reached and model.alive and model.steps < max_steps:
+        model.step()
+        peak_agents = max(peak_agents, model.frontier.size)
+    path = model.path_to() if model.goal_reached else None
+    return {"steps": model.steps, "expanded": model.expanded, "path": path, "peak_agents": peak_agents}
+
+
+def _run_search(search, maze):
+    path, expanded = search(maze)
+    # One expansion per iteration, and a single search front
+    return {"steps": expanded, "expanded": expanded, "path": path, "peak_agents": 1}
+
+
+def _run_graph(maze, solver, max_steps):
+    # Timed together with the solve, the graph is built once per call
+    graph = junctions.JunctionGraph(maze)
+    if solver == "graph-quantum":
+        path, steps, expanded, peak_agents = junctions.quantum(graph, max_steps)
+    elif solver == "graph-leftturn":
+        path, steps, expanded = junctions.wall_follow(graph, max_steps)
+        peak_agents = 1
+    else:
+        path, expanded = junctions.bfs(graph)
+        steps, peak_agents = expanded, 1
+    return {"steps": steps, "expanded": expanded, "path": path, "peak_agents": peak_agents,
+            "nodes": graph.node_count}
+
+
+def solve(maze, solver, backend="lite", max_steps=10_000_000, beam_width=None, fill=False):
+    # Metrics: steps (model ticks, or expansions for bfs/dfs), expanded cells,
+    # path_length (moves, None if the goal was not reached), peak_agents
+    # (largest number of live branches) and wall time in seconds. The graph-*
+    # solvers count bfs expansions in junction-graph nodes and add the node
+    # count of the graph as nodes. With a
+    # beam_width, the quantum solver also reports the beam and peak_parked
+    # (largest number of branches waiting outside the beam). With fill, dead
+    # ends are filled first: pruned is the number of cells removed and
+    # fill_seconds the time that took, which `seconds` does not include.
+    if beam_width is not None and solver != "quantum":
+        beam_width = None
+    pruned = fill_seconds = None
+    if fill:
+        t = time.perf_counter()
+        maze, pruned = fill_dead_ends(maze)
+        fill_seconds = time.perf_counter() - t
+    t = time.perf_counter()
+    if solver in ("quantum", "leftturn"):
+        result = _run_model(maze, solver, backend, max_steps, beam_width)
+    elif solver == "wavefront":
+        result = _run_wavefront(maze, WavefrontModel, max_steps)
+    elif solver == "bidirectional":
+        result = _run_wavefront(maze, BidirectionalWavefrontModel, max_steps)
+    elif solver == "bfs":
+        result = _run_search(bfs, maze)
+    elif solver == "dfs":
+        result = _run_search(dfs, maze)
+    elif solver in ("graph-quantum", "graph-leftturn", "graph-bfs"):
+        result = _run_graph(maze, solver, max_steps)
+    else:
+        raise ValueError(f"unknown solver {solver!r}, expected one of {SOLVER_NAMES}")
+    seconds = time.perf_counter() - t
+
+    path = result.pop("path")
+    result.setdefault("peak_parked", 0)
+    result.setdefault("nodes", None)
+    result.update(solver=solver, beam=beam_width, reached=path is not None,
+                  path_length=None if path is None else len(path) - 1, seconds=seconds,
+                  pruned=pruned, fill_seconds=fill_seconds)
+    return result
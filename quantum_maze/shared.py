@@ -0,0 +1,102 @@
+# Shared-memory maze buffers for multi-process solving.
+#
+# publish_maze() copies a maze's grid once into a multiprocessing
+# SharedMemory block and returns a small picklable SharedMazeHandle. Workers
+# call attach_maze(handle) to get a Maze whose grid is a read-only view of that
+# block, so N workers on one 100 MB maze map the same 100 MB instead of each
+# unpickling a copy. Everything a solver writes (visited bitmaps, predecessor
+# arrays, frontiers) is allocated by the model inside the worker and stays
+# private to it.
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .maze import Maze
+from .runner import solve
+
+
+class SharedMazeHandle:
+    # Everything a worker needs to attach; cheap to pickle
+    def __init__(self, name, width, height, start, goal, generator=None, seed=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.start = start
+        self.goal = goal
+        self.generator = generator
+        self.seed = seed
+
+
+class PublishedMaze:
+    # Owner side of a shared maze. Use as a context manager, or call close()
+    # when every worker is done; the block is unlinked then.
+    def __init__(self, maze):
+        self.shm = shared_memory.SharedMemory(create=True, size=max(maze.grid.nbytes, 1))
+        grid = np.ndarray(maze.grid.shape, dtype=np.uint8, buffer=self.shm.buf)
+        grid[:] = maze.grid
+        del grid
+        self.handle = SharedMazeHandle(self.shm.name, maze.width, maze.height, maze.start, maze.goal,
+                                       maze.generator, maze.seed)
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self.handle
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def publish_maze(maze):
+    return PublishedMaze(maze)
+
+
+# Blocks this process has attached, by name. Attaching is cheap but keeping
+# the SharedMemory object alive is what keeps the mapping valid.
+_attached = {}
+
+
+def attach_maze(handle, start=None, goal=None):
+    # start/goal override the published ones without touching the shared grid
+    shm = _attached.get(handle.name)
+    if shm is None:
+        shm = _attached[handle.name] = shared_memory.SharedMemory(name=handle.name)
+    grid = np.ndarray((handle.height, handle.width), dtype=np.uint8, buffer=shm.buf)
+    grid.flags.writeable = False
+    maze = Maze(handle.width, handle.height, start or handle.start, goal or handle.goal, grid)
+    maze.generator, maze.seed = handle.generator, handle.seed
+    return maze
+
+
+def detach_maze(handle):
+    shm = _attached.pop(handle.name, None)
+    if shm is not None:
+        shm.close()
+
+
+def solve_attached(handle, job):
+    # Worker side of one job: {"solver", optional "start", "goal", "backend",
+    # "max_steps"}. Detaches afterwards so a long-lived worker does not keep
+    # mazes mapped after their owner has unlinked them.
+    maze = attach_maze(handle, job.get("start"), job.get("goal"))
+    try:
+        row = solve(maze, job["solver"], job.get("backend", "lite"), job.get("max_steps", 10_000_000))
+    finally:
+        del maze
+        detach_maze(handle)
+    row.update(start=handle.start if job.get("start") is None else tuple(job["start"]),
+               goal=handle.goal if job.get("goal") is None else tuple(job["goal"]))
+    return row
+
+
+def solve_shared(maze, jobs, workers=None):
+    # Run jobs on one maze across a process pool, sharing its grid. Returns
+    # result rows in job order.
+    with publish_maze(maze) as handle, ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_attached, handle, job) for job in jobs]
+        return [future.result() for future in futures]
@@ -0,0 +1,220 @@
+# Vectorized engine for the quantum solver.
+#
+# QuantumPlayer keeps one mesa agent per branch. Because every branch claims
+# the unvisited open neighbours of its cell and a branch with several options
+# splits into one child per option, the set of live branch positions after t
+# ticks is exactly the set of cells at BFS distance t from the start. This
+# engine keeps that set as one index array (the frontier) and advances every
+# branch with a handful of NumPy operations per tick, so it takes the same
+# number of steps to reach the goal as MazeModel(maze, QuantumPlayer).
+#
+# Cells are addressed by flat indices into the grid padded with one wall cell
+# on every side, which makes neighbour lookups free of bounds checks.
+import numpy as np
+
+from .maze import OPEN
+
+
+class WavefrontModel:
+    def __init__(self, maze):
+        self.maze = maze
+        self.stride = maze.width + 2
+        # Same neighbour order as mesa's von Neumann neighbourhood: W, N, S, E
+        self.offsets = np.array([-1, -self.stride, self.stride, 1], dtype=np.intp)
+
+        # free[i]: open and not yet claimed by any branch
+        free = np.zeros((maze.height + 2, self.stride), dtype=bool)
+        free[1:-1, 1:-1] = maze.grid == OPEN
+        self.free = free.ravel()
+        self.parent = np.full(self.free.size, -1, dtype=np.intp)
+
+        start = self.index(maze.start)
+        self.goal = self.index(maze.goal)
+        self.free[start] = False
+        self.frontier = np.array([start], dtype=np.intp)
+        self.steps = 0
+        self.expanded = 1
+        self.branches = 1  # branches ever created, the analogue of mesa's next_id()
+        self.goal_reached = maze.start == maze.goal
+
+    def index(self, pos):
+        x, y = pos
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index):
+        y, x = divmod(int(index), self.stride)
+        return (x - 1, y - 1)
+
+    def positions(self):
+        return [self.position(i) for i in self.frontier]
+
+    @property
+    def alive(self):
+        # False once no branch can move any more
+        return self.frontier.size > 0
+
+    def step(self):
+        frontier = self.frontier
+        if frontier.size == 0:
+            return
+        cand = (frontier[:, None] + self.offsets).ravel()
+        src = np.repeat(frontier, 4)
+        ok = self.free[cand]
+        cand, src = cand[ok], src[ok]
+
+        # Two branches may reach the same cell on the same tick; only one of
+        # them claims it. Writing parents and reading them back keeps the last
+        # writer and drops the rest without sorting.
+        self.parent[cand] = src
+        mine = self.parent[cand] == src
+        cand, src = cand[mine], src[mine]
+        self.free[cand] = False
+
+        if cand.size > 1:
+            # A branch with k > 1 moves splits into k new branches. Children
+            # of one branch are adjacent in cand, so count the non-singleton runs.
+            same = src[1:] == src[:-1]
+            split = np.zeros(cand.size, dtype=bool)
+            split[1:] = same
+            split[:-1] |= same
+            self.branches += int(np.count_nonzero(split))
+
+        self.frontier = cand
+        self.expanded += cand.size
+        self.steps += 1
+        if not self.goal_reached and not self.free[self.goal] and self.parent[self.goal] >= 0:
+            self.goal_reached = True
+
+    def run_until_goal(self, max_steps=None):
+        while not self.goal_reached and self.alive:
+            if max_steps is not None and self.steps >= max_steps:
+                break
+            self.step()
+        return self.goal_reached
+
+    def path_to(self, pos=None):
+        # Cells from the start to pos (default: the goal), or None if unreached
+        i = self.goal if pos is None else self.index(pos)
+        start = self.index(self.maze.start)
+        if i != start and self.parent[i] < 0:
+            return None
+        path = []
+        parent = self.parent
+        while i != start:
+            path.append(self.position(i))
+            i = parent[i]
+        path.append(self.maze.start)
+        path.reverse()
+        return path
+
+
+# Owner values of BidirectionalWavefrontModel cells
+FREE, FROM_START, FROM_GOAL, BLOCKED = 0, 1, 2, 3
+
+
+class BidirectionalWavefrontModel:
+    # Two superpositions on the same padded grid: one spreading from the
+    # start, one from the goal, each advancing one layer per tick with the same
+    # claim-and-split rule as WavefrontModel. As soon as a branch of one side
+    # steps onto a cell owned by the other, the fronts have met; the shortest
+    # crossing found in that layer joins the two predecessor chains.
+    def __init__(self, maze):
+        self.maze = maze
+        self.stride = maze.width + 2
+        self.offsets = np.array([-1, -self.stride, self.stride, 1], dtype=np.intp)
+
+        owner = np.full((maze.height + 2, self.stride), BLOCKED, dtype=np.uint8)
+        owner[1:-1, 1:-1][maze.grid == OPEN] = FREE
+        self.owner = owner.ravel()
+        self.parent = np.full(self.owner.size, -1, dtype=np.intp)
+        self.dist = np.zeros(self.owner.size, dtype=np.int32)
+
+        self.start = self.index(maze.start)
+        self.goal = self.index(maze.goal)
+        # A goal inside a wall can never be reached, so it seeds no front
+        goal_open = self.owner[self.goal] == FREE
+        self.owner[self.start] = FROM_START
+        self.owner[self.goal] = FROM_GOAL if goal_open else BLOCKED
+        self.fronts = {FROM_START: np.array([self.start], dtype=np.intp),
+                       FROM_GOAL: np.array([self.goal] if goal_open else [], dtype=np.intp)}
+        self.steps = 0
+        self.expanded = 1 if self.start == self.goal else 1 + int(goal_open)
+        self.meeting = None  # (cell on the start side, cell on the goal side)
+        self.goal_reached = self.start == self.goal
+
+    index = WavefrontModel.index
+    position = WavefrontModel.position
+
+    @property
+    def frontier(self):
+        return np.concatenate([self.fronts[FROM_START], self.fronts[FROM_GOAL]])
+
+    def positions(self):
+        return [self.position(i) for i in self.frontier]
+
+    @property
+    def alive(self):
+        # Either front dying out means start and goal are not connected
+        return self.fronts[FROM_START].size > 0 and self.fronts[FROM_GOAL].size > 0
+
+    def _advance(self, side):
+        frontier = self.fronts[side]
+        cand = (frontier[:, None] + self.offsets).ravel()
+        src = np.repeat(frontier, 4)
+        owner = self.owner[cand]
+
+        hit = np.flatnonzero(owner == FROM_START + FROM_GOAL - side)
+        if hit.size:
+            lengths = self.dist[src[hit]] + self.dist[cand[hit]]
+            best = hit[np.argmin(lengths)]
+            a, b = int(src[best]), int(cand[best])
+            self.meeting = (a, b) if side == FROM_START else (b, a)
+            self.goal_reached = True
+            return
+
+        ok = owner == FREE
+        cand, src = cand[ok], src[ok]
+        self.parent[cand] = src
+        mine = self.parent[cand] == src
+        cand, src = cand[mine], src[mine]
+        self.owner[cand] = side
+        self.dist[cand] = self.dist[src] + 1
+        self.fronts[side] = cand
+        self.expanded += cand.size
+
+    def step(self):
+        if self.goal_reached:
+            return
+        for side in (FROM_START, FROM_GOAL):
+            if self.fronts[side].size:
+                self._advance(side)
+            if self.goal_reached:
+                break
+        self.steps += 1
+
+    def run_until_goal(self, max_steps=None):
+        while not self.goal_reached and self.alive:
+            if max_steps is not None and self.steps >= max_steps:
+                break
+            self.step()
+        return self.goal_reached
+
+    def _chain(self, i):
+        cells = []
+        while i >= 0:
+            cells.append(self.position(i))
+            i = self.parent[i]
+        return cells
+
+    def path_to(self, pos=None):
+        # Start-to-goal path through the meeting point, or None if not met.
+        # (pos is accepted for symmetry with WavefrontModel; only the goal
+        # has a meaningful bidirectional path.)
+        if pos is not None and self.index(pos) != self.goal:
+            raise ValueError("a bidirectional search only has a path to the goal")
+        if self.start == self.goal:
+            return [self.maze.start]
+        if self.meeting is None:
+            return None
+        a, b = self.meeting
+        return self._chain(a)[::-1] + self._chain(b)